@@ -210,10 +210,11 @@ def sort_qualified_edges(graph) -> Iterable[EdgeTuple]:
 
     :param BELGraph graph: A BEL graph
     """
+    # The edge data is already at hand, so check it directly instead of looking it up again through the graph
     qualified_edges = (
         (u, v, k, d)
         for u, v, k, d in graph.edges(keys=True, data=True)
-        if graph.has_edge_citation(u, v, k) and graph.has_edge_evidence(u, v, k)
+        if CITATION in d and EVIDENCE in d
     )
     return sorted(qualified_edges, key=_sort_qualified_edges_helper)
 
@@ -319,10 +320,12 @@ def _to_bel_lines_footer(graph, use_identifiers: bool = False) -> Iterable[str]:
         if d[RELATION] in UNQUALIFIED_EDGES and EVIDENCE not in d
     ]
 
+    # Each access to graph.pred or graph.succ makes a new adjacency view, so only make them once
+    pred, succ = graph.pred, graph.succ
     isolated_nodes_to_serialize = [
         node
         for node in graph
-        if not graph.pred[node] and not graph.succ[node]
+        if not pred[node] and not succ[node]
     ]
 
     if unqualified_edges_to_serialize or isolated_nodes_to_serialize:
@@ -11,9 +11,9 @@ from .exc import InferCentralDogmaException, ListAbundanceEmptyException, Reacti
 from ..constants import (
     ABUNDANCE, BEL_DEFAULT_NAMESPACE, BIOPROCESS, COMPLEX, COMPOSITE, CONCEPT, FRAGMENT, FRAGMENT_DESCRIPTION,
     FRAGMENT_MISSING, FRAGMENT_START, FRAGMENT_STOP, FUNCTION, FUSION, FUSION_MISSING, FUSION_REFERENCE, FUSION_START,
-    FUSION_STOP, GENE, GMOD, HGVS, KIND, MEMBERS, MIRNA, PARTNER_3P, PARTNER_5P, PATHOLOGY, PMOD, PMOD_CODE, PMOD_ORDER,
-    PMOD_POSITION, POPULATION, PRODUCTS, PROTEIN, RANGE_3P, RANGE_5P, REACTANTS, REACTION, RNA, VARIANTS, XREFS,
-    rev_abundance_labels,
+    FUSION_STOP, GENE, GMOD, HGVS, IDENTIFIER, KIND, MEMBERS, MIRNA, NAME, PARTNER_3P, PARTNER_5P, PATHOLOGY, PMOD,
+    PMOD_CODE, PMOD_ORDER, PMOD_POSITION, POPULATION, PRODUCTS, PROTEIN, RANGE_3P, RANGE_5P, REACTANTS, REACTION, RNA,
+    VARIANTS, XREFS, rev_abundance_labels,
 )
 from ..language import Entity
 
@@ -74,12 +74,17 @@ class BaseEntity(dict, metaclass=ABCMeta):
     It can be converted to a tuple and hashed.
     """
 
+    # Graphs hold many nodes, so the cached hashes are kept in slots rather than a per-instance dictionary, which more
+    # than halves the memory used by each node. Subclasses should also define __slots__ to keep this benefit.
+    __slots__ = ('_md5', '_bel')
+
     function = ...
 
     def __init__(self) -> None:
         """Build a PyBEL node."""
         super().__init__(**{FUNCTION: self.function})
         self._md5 = None
+        self._bel = None
 
     @property
     def _bel_function(self) -> str:
@@ -89,18 +94,62 @@ class BaseEntity(dict, metaclass=ABCMeta):
     def as_bel(self, use_identifiers: bool = True) -> str:
         """Return this entity as a BEL string."""
 
+    @property
+    def canonical_bel(self) -> str:
+        """Get the BEL string of this node, which is used for hashing and equality.
+
+        It's the same as :meth:`as_bel` with the default arguments, but it's built once and cached because nodes are
+        hashed on every lookup in a graph. The cache is cleared whenever an entry of the node is set or removed.
+        """
+        if self._bel is None:
+            self._bel = self.as_bel()
+        return self._bel
+
+    def _clear_cache(self) -> None:
+        self._md5 = None
+        self._bel = None
+
+    def __setitem__(self, key, value):  # noqa: D105
+        super().__setitem__(key, value)
+        self._clear_cache()
+
+    def __delitem__(self, key):  # noqa: D105
+        super().__delitem__(key)
+        self._clear_cache()
+
+    def setdefault(self, key, default=None):  # noqa: D102
+        # The default is often changed in place after it's returned, like a list of variants that gets appended to
+        self._clear_cache()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):  # noqa: D102
+        super().update(*args, **kwargs)
+        self._clear_cache()
+
+    def pop(self, *args):  # noqa: D102
+        self._clear_cache()
+        return super().pop(*args)
+
+    def popitem(self):  # noqa: D102
+        self._clear_cache()
+        return super().popitem()
+
+    def clear(self):  # noqa: D102
+        super().clear()
+        self._clear_cache()
+
     @property
     def md5(self) -> str:
         """Get the MD5 hash of this node."""
         if self._md5 is None:
-            self._md5 = hashlib.md5(self.as_bel().encode('utf8')).hexdigest()  # noqa: S303
+            self._md5 = hashlib.md5(self.canonical_bel.encode('utf8')).hexdigest()  # noqa: S303
         return self._md5
 
     def __hash__(self):  # noqa: D105
-        return hash(self.as_bel())
+        return hash(self.canonical_bel)
 
     def __eq__(self, other):
-        return isinstance(other, BaseEntity) and self.as_bel() == other.as_bel()
+        return isinstance(other, BaseEntity) and self.canonical_bel == other.canonical_bel
 
     def __repr__(self):
         return '<BEL {bel}>'.format(bel=self.as_bel(use_identifiers=True))
@@ -116,6 +165,8 @@ class BaseAbundance(BaseEntity):
     overridden.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         namespace: str,
@@ -174,11 +225,17 @@ class BaseAbundance(BaseEntity):
         """The OBO-style identifier for this node."""
         return self.entity.obo
 
+    def _concept_as_bel(self, use_identifiers: bool) -> str:
+        entity = self[CONCEPT]
+        if use_identifiers and entity.get(IDENTIFIER) and entity.get(NAME):
+            return entity.obo
+        return entity.curie
+
     def as_bel(self, use_identifiers: bool = True) -> str:
         """Return this node as a BEL string."""
         return "{}({})".format(
             self._bel_function,
-            self.obo if use_identifiers and self.entity.identifier and self.entity.name else self.curie,
+            self._concept_as_bel(use_identifiers),
         )
 
 
@@ -190,6 +247,8 @@ class Abundance(BaseAbundance):
 
     """
 
+    __slots__ = ()
+
     function = ABUNDANCE
 
 
@@ -201,6 +260,8 @@ class BiologicalProcess(BaseAbundance):
 
     """
 
+    __slots__ = ()
+
     function = BIOPROCESS
 
 
@@ -212,6 +273,8 @@ class Pathology(BaseAbundance):
 
     """
 
+    __slots__ = ()
+
     function = PATHOLOGY
 
 
@@ -223,12 +286,16 @@ class Population(BaseAbundance):
 
     """
 
+    __slots__ = ()
+
     function = POPULATION
 
 
 class Variant(dict, metaclass=ABCMeta):
     """The superclass for variant dictionaries."""
 
+    __slots__ = ()
+
     def __init__(self, kind: str) -> None:
         """Build the variant data dictionary.
 
@@ -251,6 +318,8 @@ class Variant(dict, metaclass=ABCMeta):
 class CentralDogma(BaseAbundance):
     """The base class for "central dogma" abundances (i.e., genes, miRNAs, RNAs, and proteins)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         namespace: str,
@@ -284,14 +353,14 @@ class CentralDogma(BaseAbundance):
         if not self.variants:
             return super().as_bel(use_identifiers=use_identifiers)
 
-        variants_canon = sorted([
+        variants_canon = sorted(
             variant.as_bel(use_identifiers=use_identifiers)
-            for variant in self.variants
-        ])
+            for variant in self[VARIANTS]
+        )
 
         return "{}({}, {})".format(
             self._bel_function,
-            self.obo if use_identifiers and self.entity.identifier and self.entity.name else self.curie,
+            self._concept_as_bel(use_identifiers),
             ', '.join(variants_canon),
         )
 
@@ -308,11 +377,14 @@ class CentralDogma(BaseAbundance):
         if VARIANTS not in self:
             return None
 
+        # This is called for every variant node added to a graph, so look up the concept once
+        # and don't go through the properties
+        entity = self[CONCEPT]
         return self.__class__(
-            namespace=self.namespace,
-            name=self.name,
-            identifier=self.identifier,
-            xrefs=self.xrefs,
+            namespace=entity.namespace,
+            name=entity.name,
+            identifier=entity.identifier,
+            xrefs=self.get(XREFS),
         )
 
     def with_variants(self, variants: Union[Variant, List[Variant]]) -> 'CentralDogma':
@@ -327,11 +399,12 @@ class CentralDogma(BaseAbundance):
         >>> assert 'p(HGNC:APP, frag(672_713))' == ab42.as_bel()
 
         """
+        entity = self[CONCEPT]
         return self.__class__(
-            namespace=self.namespace,
-            name=self.name,
-            identifier=self.identifier,
-            xrefs=self.xrefs,
+            namespace=entity.namespace,
+            name=entity.name,
+            identifier=entity.identifier,
+            xrefs=self.get(XREFS),
             variants=variants,
         )
 
@@ -339,6 +412,8 @@ class CentralDogma(BaseAbundance):
 class ProteinModification(Variant):
     """Build a protein modification variant dictionary."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -411,6 +486,8 @@ class ProteinModification(Variant):
 class GeneModification(Variant):
     """Build a gene modification variant dictionary."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -463,6 +540,8 @@ class GeneModification(Variant):
 class Hgvs(Variant):
     """Builds a HGVS variant dictionary."""
 
+    __slots__ = ()
+
     def __init__(self, variant: str) -> None:
         """Build an HGVS variant data dictionary.
 
@@ -488,6 +567,8 @@ class Hgvs(Variant):
 class HgvsReference(Hgvs):
     """Represents the "reference" variant in HGVS."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(variant='=')
 
@@ -495,6 +576,8 @@ class HgvsReference(Hgvs):
 class HgvsUnspecified(Hgvs):
     """Represents an unspecified variant in HGVS."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(variant='?')
 
@@ -502,6 +585,8 @@ class HgvsUnspecified(Hgvs):
 class ProteinSubstitution(Hgvs):
     """A protein substitution variant."""
 
+    __slots__ = ()
+
     def __init__(self, from_aa: str, position: int, to_aa: str) -> None:
         """Build an HGVS variant data dictionary for the given protein substitution.
 
@@ -519,6 +604,8 @@ class ProteinSubstitution(Hgvs):
 class Fragment(Variant):
     """Represent the information about a protein fragment."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         start: Union[None, int, str] = None,
@@ -572,12 +659,16 @@ class Fragment(Variant):
 class Gene(CentralDogma):
     """Builds a gene node."""
 
+    __slots__ = ()
+
     function = GENE
 
 
 class _Transcribable(CentralDogma):
     """A base class for RNA and micro-RNA to share getting of their corresponding genes."""
 
+    __slots__ = ()
+
     def get_gene(self) -> Gene:
         """Get the corresponding gene or raise an exception if it's not the reference node.
 
@@ -586,11 +677,12 @@ class _Transcribable(CentralDogma):
         if self.variants:
             raise InferCentralDogmaException('can not get gene for variant')
 
+        entity = self[CONCEPT]
         return Gene(
-            namespace=self.namespace,
-            name=self.name,
-            identifier=self.identifier,
-            xrefs=self.xrefs,
+            namespace=entity.namespace,
+            name=entity.name,
+            identifier=entity.identifier,
+            xrefs=self.get(XREFS),
         )
 
 
@@ -606,6 +698,8 @@ class Rna(_Transcribable):
     >>> Rna(namespace='SNORNABASE', identifier='SR0000073')
     """
 
+    __slots__ = ()
+
     function = RNA
 
 
@@ -628,6 +722,8 @@ class MicroRna(_Transcribable):
     >>> MicroRna(namespace='ENTREZ', identifier='406904')
     """
 
+    __slots__ = ()
+
     function = MIRNA
 
 
@@ -647,6 +743,8 @@ class Protein(CentralDogma):
     >>> Protein(namespace='HGNC', name='AKT', variants=[ProteinModification('Ph', code='Thr', position=308)])
     """
 
+    __slots__ = ()
+
     function = PROTEIN
 
     def get_rna(self) -> Rna:
@@ -657,11 +755,12 @@ class Protein(CentralDogma):
         if self.variants:
             raise InferCentralDogmaException('can not get rna for variant')
 
+        entity = self[CONCEPT]
         return Rna(
-            namespace=self.namespace,
-            name=self.name,
-            identifier=self.identifier,
-            xrefs=self.xrefs,
+            namespace=entity.namespace,
+            name=entity.name,
+            identifier=entity.identifier,
+            xrefs=self.get(XREFS),
         )
 
 
@@ -676,6 +775,8 @@ def _entity_list_as_bel(entities: Iterable[BaseEntity], use_identifiers: bool =
 class Reaction(BaseEntity):
     """Build a reaction node."""
 
+    __slots__ = ()
+
     function = REACTION
 
     def __init__(
@@ -737,6 +838,8 @@ class Reaction(BaseEntity):
 class ListAbundance(BaseEntity):
     """The superclass for building list abundance (complex, abundance) node data dictionaries."""
 
+    __slots__ = ()
+
     def __init__(self, members: Union[BaseAbundance, Iterable[BaseAbundance]]) -> None:
         """Build a list abundance node.
 
@@ -768,6 +871,8 @@ class ListAbundance(BaseEntity):
 class ComplexAbundance(ListAbundance):
     """Build a complex abundance node with the optional ability to specify a name."""
 
+    __slots__ = ()
+
     function = COMPLEX
 
     def __init__(
@@ -815,18 +920,24 @@ class NamedComplexAbundance(BaseAbundance):
 
     """
 
+    __slots__ = ()
+
     function = COMPLEX
 
 
 class CompositeAbundance(ListAbundance):
     """Build a composite abundance node."""
 
+    __slots__ = ()
+
     function = COMPOSITE
 
 
 class FusionRangeBase(dict, metaclass=ABCMeta):
     """The superclass for fusion range data dictionaries."""
 
+    __slots__ = ()
+
     @abstractmethod
     def as_bel(self) -> str:
         """Return this fusion range as BEL."""
@@ -838,6 +949,8 @@ class FusionRangeBase(dict, metaclass=ABCMeta):
 class MissingFusionRange(FusionRangeBase):
     """Represents a fusion range with no defined start or end."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Build a missing fusion range."""
         super(MissingFusionRange, self).__init__({
@@ -852,6 +965,8 @@ class MissingFusionRange(FusionRangeBase):
 class EnumeratedFusionRange(FusionRangeBase):
     """Represents an enumerated fusion range."""
 
+    __slots__ = ()
+
     def __init__(self, reference: str, start, stop):
         """Build an enumerated fusion range.
 
@@ -882,6 +997,8 @@ class EnumeratedFusionRange(FusionRangeBase):
 class FusionBase(BaseEntity):
     """The superclass for building fusion node data dictionaries."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         partner_5p: CentralDogma,
@@ -948,6 +1065,8 @@ class FusionBase(BaseEntity):
 class ProteinFusion(FusionBase):
     """Builds a protein fusion node."""
 
+    __slots__ = ()
+
     function = PROTEIN
 
 
@@ -973,6 +1092,8 @@ class RnaFusion(FusionBase):
 
     """
 
+    __slots__ = ()
+
     function = RNA
 
 
@@ -997,4 +1118,6 @@ class GeneFusion(FusionBase):
 
     """
 
+    __slots__ = ()
+
     function = GENE
@@ -17,6 +17,8 @@ from .utils import ensure_quotes
 class Entity(dict):
     """Represents a named entity with a namespace and name/identifier."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -61,12 +63,13 @@ class Entity(dict):
     @property
     def curie(self) -> str:
         """Return this entity as a CURIE."""
-        if self[NAMESPACE] == BEL_DEFAULT_NAMESPACE:
+        namespace = self[NAMESPACE]
+        if namespace == BEL_DEFAULT_NAMESPACE:
             return self[NAME]
 
         return '{}:{}'.format(
-            self.namespace,
-            ensure_quotes(self.identifier if self.identifier else self.name),
+            namespace,
+            ensure_quotes(self.get(IDENTIFIER) or self.get(NAME)),
         )
 
     @property
@@ -133,7 +136,8 @@ activity_mapping = {
     'gap': Entity(namespace='GO', name='GTPase activating protein binding', identifier='GO:0032794'),
 }
 
-activities = list(activity_labels.keys())
+#: All labels for activities. Every short label also maps to itself in :data:`activity_labels`, so its keys suffice.
+activities = list(activity_labels)
 
 cytoplasm = Entity(name='cytoplasm', namespace='GO', identifier='GO:0005737')
 nucleus = Entity(name='nucleus', namespace='GO', identifier='GO:0005634')
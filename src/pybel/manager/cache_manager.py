@@ -170,16 +170,29 @@ class NamespaceManager(BaseManager):
                 version=BEL_DEFAULT_NAMESPACE_VERSION,
                 url=BEL_DEFAULT_NAMESPACE_URL,
             )
-
-            for name in set(chain(pmod_mappings, gmod_mappings, activity_mapping, compartment_mapping)):
-                entry = NamespaceEntry(name=name, namespace=namespace)
-                self.session.add(entry)
-
-            self.session.add(namespace)
+            self._insert_entries(namespace, [
+                dict(name=name)
+                for name in set(chain(pmod_mappings, gmod_mappings, activity_mapping, compartment_mapping))
+            ])
             self.session.commit()
 
         return namespace
 
+    def _insert_entries(self, namespace: Namespace, entries: List[Dict[str, Any]]) -> None:
+        """Add a namespace and insert its entries in bulk. Need to commit after!
+
+        Building an ORM object for each entry is slow for namespaces with many thousands of names, so the namespace is
+        flushed to get its primary key and the entries are inserted directly from their column values instead.
+
+        :param namespace: A namespace that hasn't been added to the session yet
+        :param entries: The column values for each of the namespace's entries
+        """
+        self.session.add(namespace)
+        self.session.flush()
+        for entry in entries:
+            entry['namespace_id'] = namespace.id
+        self.session.bulk_insert_mappings(NamespaceEntry, entries)
+
     def get_or_create_namespace(self, url: str) -> Namespace:
         """Insert the namespace file at the given location to the cache.
 
@@ -220,13 +233,11 @@ class NamespaceManager(BaseManager):
             **namespace_insert_values,
         )
 
-        logger.debug('building NamespaceEntry instances')
-        namespace.entries = [
-            NamespaceEntry(name=name, encoding=encoding, identifier=name_to_id.get(name))
+        logger.debug('inserting namespace entries')
+        self._insert_entries(namespace, [
+            dict(name=name, encoding=encoding, identifier=name_to_id.get(name))
             for name, encoding in values.items()
-        ]
-
-        self.session.add(namespace)
+        ])
 
         logger.debug('committing namespace')
         self.session.commit()
@@ -341,13 +352,11 @@ class NamespaceManager(BaseManager):
             is_annotation=True,
             **_get_annotation_insert_values(bel_resource),
         )
-        result.entries = [
-            NamespaceEntry(name=name, identifier=label)
+        self._insert_entries(result, [
+            dict(name=name, identifier=label)
             for name, label in bel_resource['Values'].items()
             if name
-        ]
-
-        self.session.add(result)
+        ])
         self.session.commit()
 
         logger.info(
@@ -487,7 +496,7 @@ class NetworkManager(NamespaceManager):
         """Return all of the versions of a network with the given name."""
         return {
             version
-            for version, in self.session.query(Network.version).filter(Network.name == name).all()
+            for version, in self.session.query(Network.version).filter(Network.name == name)
         }
 
     def get_network_by_name_version(self, name: str, version: str) -> Optional[Network]:
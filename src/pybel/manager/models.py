@@ -130,9 +130,14 @@ class Namespace(Base):
         return self.keyword
 
     def get_term_to_encodings(self) -> Mapping[Tuple[Optional[str], str], str]:
-        """Return the term (db, id, name) to encodings from this namespace."""
+        """Return the term (db, id, name) to encodings from this namespace.
+
+        Each entry loaded from the database comes with its own copy of its encoding string, but there are only a few
+        distinct encodings (e.g., ``GRP``) in a namespace, so the copies are replaced by one shared string apiece.
+        """
+        encodings = {}
         return {
-            (entry.identifier, entry.name): entry.encoding
+            (entry.identifier, entry.name): encodings.setdefault(entry.encoding, entry.encoding)
             for entry in self.entries
         }
 
@@ -3,8 +3,9 @@
 """The base parser class shared by several BEL parsers."""
 
 import logging
+import os
 import time
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
 from pyparsing import ParseResults, ParserElement
 
@@ -12,6 +13,44 @@ __all__ = ['BaseParser']
 
 logger = logging.getLogger(__name__)
 
+#: The environment variable that sets the size of the PyParsing packrat cache. Leave unset (or set to zero) for an
+#: unbounded cache and set to a negative number to disable packrat parsing entirely.
+PYBEL_PACKRAT_CACHE = 'PYBEL_PACKRAT_CACHE'
+
+
+def _get_packrat_cache_size_limit() -> Optional[int]:
+    """Get the packrat cache size limit from the environment, or a negative number if packrat parsing is disabled."""
+    value = os.environ.get(PYBEL_PACKRAT_CACHE)
+    if not value:
+        return None
+    try:
+        cache_size_limit = int(value)
+    except ValueError:
+        logger.warning('invalid value for %s: %r. Using an unbounded packrat cache', PYBEL_PACKRAT_CACHE, value)
+        return None
+    return cache_size_limit or None
+
+
+def enable_packrat() -> None:
+    """Enable PyParsing's packrat memoization for all parsers.
+
+    The BEL grammar is full of alternations that share long prefixes (e.g., the fusion, modified, and simple forms of
+    ``p()``), so the same sub-expressions get tried at the same location many times. Memoizing them avoids re-parsing.
+    The packrat cache is cleared at the beginning of every call to :meth:`pyparsing.ParserElement.parseString`, so
+    its memory use scales with the length of a single line and not with the size of the document.
+    """
+    cache_size_limit = _get_packrat_cache_size_limit()
+    if cache_size_limit is not None and cache_size_limit < 0:
+        logger.debug('packrat parsing disabled with %s=%d', PYBEL_PACKRAT_CACHE, cache_size_limit)
+        return
+    try:
+        ParserElement.enablePackrat(cache_size_limit=cache_size_limit)
+    except TypeError:  # older versions of PyParsing don't take a cache size limit
+        ParserElement.enablePackrat()
+
+
+enable_packrat()
+
 
 class BaseParser(object):
     """This abstract class represents a language backed by a PyParsing statement.
@@ -35,8 +74,9 @@ class BaseParser(object):
 
     def parse_lines(self, lines: Iterable[str]) -> List[ParseResults]:
         """Parse multiple lines in succession."""
+        parse_string = self.parseString
         return [
-            self.parseString(line, line_number)
+            parse_string(line, line_number)
             for line_number, line in enumerate(lines)
         ]
 
@@ -11,3 +11,16 @@ from .protein_modification import get_protein_modification_language
 from .protein_substitution import get_protein_substitution_language
 from .truncation import get_truncation_language
 from .variant import get_hgvs_language
+
+__all__ = [
+    'get_fragment_language',
+    'get_fusion_language',
+    'get_legacy_fusion_langauge',
+    'get_gene_modification_language',
+    'get_gene_substitution_language',
+    'get_location_language',
+    'get_protein_modification_language',
+    'get_protein_substitution_language',
+    'get_truncation_language',
+    'get_hgvs_language',
+]
@@ -2,26 +2,35 @@
 
 """Constants for modifier parsers."""
 
-from pyparsing import Keyword, MatchFirst, oneOf
+from pyparsing import ParseResults, Regex
 
 from ..exc import PlaceholderAminoAcidWarning
 from ... import language
 
-aa_single = oneOf(list(language.amino_acid_dict.keys()))
-aa_single.setParseAction(lambda s, l, t: [language.amino_acid_dict[t[0]]])
-
-aa_triple = oneOf(list(language.amino_acid_dict.values()))
-
-#: In biological literature, the X is used to denote a truncation. Text mining efforts often encode X as an amino
-#: acid, for which we will throw an error using :func:`handle_aa_placeholder`
-aa_placeholder = Keyword('X')
-
 
 def handle_aa_placeholder(line, position, tokens):
     """Raise an exception when encountering a placeholder amino acid, ``X``."""
     raise PlaceholderAminoAcidWarning(-1, line, position, tokens[0])
 
 
-aa_placeholder.setParseAction(handle_aa_placeholder)
+#: Matches a three-letter amino acid code from :data:`pybel.language.amino_acid_dict`, a one-letter code, or the
+#: placeholder ``X``, in that order. In biological literature, the X is used to denote a truncation. Text mining
+#: efforts often encode X as an amino acid, for which we will throw an error using :func:`handle_aa_placeholder`
+_AMINO_ACID_RE = r'(?P<triple>{triples})|(?P<single>[{singles}])|(?P<placeholder>X)(?![A-Za-z0-9_$])'.format(
+    triples='|'.join(language.amino_acid_dict.values()),
+    singles=''.join(language.amino_acid_dict),
+)
+
+
+def _handle_amino_acid(line: str, position: int, tokens: ParseResults):
+    """Normalize a matched amino acid to its three-letter code."""
+    if tokens['placeholder'] is not None:
+        handle_aa_placeholder(line, position, tokens)
+
+    single = tokens['single']
+    if single is not None:
+        return [language.amino_acid_dict[single]]
+    return [tokens['triple']]
+
 
-amino_acid = MatchFirst([aa_triple, aa_single, aa_placeholder])
+amino_acid = Regex(_AMINO_ACID_RE).setName('amino acid').setParseAction(_handle_amino_acid)
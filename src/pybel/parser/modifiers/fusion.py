@@ -37,12 +37,9 @@ it is shown with uppercase letters referring to constants from :code:`pybel.cons
     - PyBEL module :py:class:`pybel.parser.modifiers.get_legacy_fusion_language`
 """
 
-from pyparsing import (
-    Group, Keyword, Optional, ParserElement, Suppress, oneOf, pyparsing_common,
-    pyparsing_common as ppc, replaceWith,
-)
+from pyparsing import Group, Optional, ParseResults, ParserElement, Regex, pyparsing_common as ppc, replaceWith
 
-from ..utils import WCW, nest
+from ..utils import WCW, _named_results, nest, one_of_keywords
 from ...constants import (
     CONCEPT, FUSION, FUSION_MISSING, FUSION_REFERENCE, FUSION_START, FUSION_STOP, PARTNER_3P, PARTNER_5P, RANGE_3P,
     RANGE_5P,
@@ -54,28 +51,37 @@ __all__ = [
     'get_legacy_fusion_langauge',
 ]
 
-fusion_tags = oneOf(['fus', 'fusion']).setParseAction(replaceWith(FUSION))
-reference_seq = oneOf(['r', 'p', 'c'])
-coordinate = pyparsing_common.integer | '?'
-missing = Keyword('?')
-range_coordinate_unquoted = (
-    missing(FUSION_MISSING)
-    | (
-        reference_seq(FUSION_REFERENCE)
-        + Suppress('.')
-        + coordinate(FUSION_START)
-        + Suppress('_')
-        + coordinate(FUSION_STOP)
-    )
+fusion_tags = one_of_keywords(['fus', 'fusion']).setParseAction(replaceWith(FUSION))
+
+#: Matches a missing range, like ``?``, or a range with a reference and two coordinates, like ``r.1_79`` or ``c.?_1``.
+#: The quote before the range is captured so the same one has to close it.
+_RANGE_COORDINATE_FMT = (
+    r'(?P<quote>{quote})\s*'
+    r'(?:(?P<missing>\?)|(?P<reference>[rpc])\s*\.\s*(?P<start>[0-9]+|\?)\s*_\s*(?P<stop>[0-9]+|\?))'
+    r'\s*(?P=quote)'
 )
 
 
+def _handle_range_coordinate(tokens: ParseResults) -> ParseResults:
+    """Convert the groups matched by a fusion range's regular expression to named tokens."""
+    if tokens['missing'] is not None:
+        return _named_results([(FUSION_MISSING, '?')])
+
+    start, stop = (
+        int(coordinate) if coordinate != '?' else coordinate
+        for coordinate in (tokens['start'], tokens['stop'])
+    )
+    return _named_results([(FUSION_REFERENCE, tokens['reference']), (FUSION_START, start), (FUSION_STOP, stop)])
+
+
 def get_fusion_language(concept: ParserElement, permissive: bool = True) -> ParserElement:
-    """Build a fusion parser."""
-    range_coordinate = Suppress('"') + range_coordinate_unquoted + Suppress('"')
+    """Build a fusion parser.
 
-    if permissive:  # permissive to wrong quoting
-        range_coordinate = range_coordinate | range_coordinate_unquoted
+    :param concept: The parser for the fusion partners
+    :param permissive: If true, also accept ranges that aren't quoted
+    """
+    range_coordinate = Regex(_RANGE_COORDINATE_FMT.format(quote='"?' if permissive else '"'))
+    range_coordinate.setName('fusion range').setParseAction(_handle_range_coordinate)
 
     return fusion_tags + nest(
         Group(Group(concept)(CONCEPT))(PARTNER_5P),
@@ -105,7 +111,10 @@ def get_legacy_fusion_langauge(concept: ParserElement, reference: str) -> Parser
 
 
 def _fusion_legacy_handler(_, __, tokens):
-    """Handle a legacy fusion."""
+    """Handle a legacy fusion.
+
+    Updating the tokens in place is safe with packrat parsing because PyParsing caches a copy of them.
+    """
     if RANGE_5P not in tokens:
         tokens[RANGE_5P] = {FUSION_MISSING: '?'}
     if RANGE_3P not in tokens:
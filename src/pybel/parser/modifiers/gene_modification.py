@@ -44,8 +44,8 @@ in the OpenBEL community.
 
 from pyparsing import Group, MatchFirst, ParserElement, oneOf
 
-from ..utils import nest, one_of_tags
-from ...constants import BEL_DEFAULT_NAMESPACE, CONCEPT, GMOD, KIND, NAME, NAMESPACE
+from ..utils import handle_default_namespace, nest, one_of_tags
+from ...constants import CONCEPT, GMOD, KIND
 from ...language import gmod_namespace
 
 __all__ = [
@@ -53,14 +53,8 @@ __all__ = [
 ]
 
 
-def _handle_gmod_default(_, __, tokens):
-    tokens[NAMESPACE] = BEL_DEFAULT_NAMESPACE
-    tokens[NAME] = gmod_namespace[tokens[0]]
-    return tokens
-
-
 gmod_tag = one_of_tags(tags=['gmod', 'geneModification'], canonical_tag=GMOD, name=KIND)
-gmod_default_ns = oneOf(list(gmod_namespace)).setParseAction(_handle_gmod_default)
+gmod_default_ns = oneOf(list(gmod_namespace)).setParseAction(handle_default_namespace(gmod_namespace))
 
 
 def get_gene_modification_language(concept_qualified: ParserElement) -> ParserElement:
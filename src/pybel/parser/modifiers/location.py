@@ -44,16 +44,16 @@ This calls for thoughtful consideration of the following two statements:
     - PyBEL module :py:class:`pybel.parser.modifiers.get_location_language`
 """
 
-from pyparsing import Group, ParserElement, Suppress, oneOf
+from pyparsing import Group, ParserElement, Suppress
 
-from ..utils import nest
+from ..utils import nest, one_of_keywords
 from ...constants import LOCATION
 
 __all__ = [
     'get_location_language',
 ]
 
-location_tag = Suppress(oneOf(['loc', 'location']))
+location_tag = Suppress(one_of_keywords(['loc', 'location']))
 
 
 def get_location_language(identifier: ParserElement) -> ParserElement:
@@ -79,7 +79,7 @@ import logging
 from pyparsing import Group, MatchFirst, Optional, ParseResults, ParserElement, oneOf, pyparsing_common as ppc
 
 from .constants import amino_acid
-from ..utils import WCW, nest, one_of_tags
+from ..utils import WCW, handle_default_namespace, nest, one_of_tags
 from ...constants import BEL_DEFAULT_NAMESPACE, CONCEPT, KIND, NAME, NAMESPACE, PMOD, PMOD_CODE, PMOD_POSITION
 from ...language import pmod_legacy_labels, pmod_namespace
 
@@ -90,12 +90,6 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-def _handle_pmod_default_ns(_, __, tokens: ParseResults) -> ParseResults:
-    tokens[NAMESPACE] = BEL_DEFAULT_NAMESPACE
-    tokens[NAME] = pmod_namespace[tokens[0]]
-    return tokens
-
-
 def _handle_pmod_legacy_ns(line, _, tokens: ParseResults) -> ParseResults:
     upgraded = pmod_legacy_labels[tokens[0]]
     logger.log(5, 'legacy pmod() value %s upgraded to %s', line, upgraded)
@@ -105,7 +99,7 @@ def _handle_pmod_legacy_ns(line, _, tokens: ParseResults) -> ParseResults:
 
 
 pmod_tag = one_of_tags(tags=['pmod', 'proteinModification'], canonical_tag=PMOD, name=KIND)
-pmod_default_ns = oneOf(list(pmod_namespace)).setParseAction(_handle_pmod_default_ns)
+pmod_default_ns = oneOf(list(pmod_namespace)).setParseAction(handle_default_namespace(pmod_namespace))
 pmod_legacy_ns = oneOf(list(pmod_legacy_labels)).setParseAction(_handle_pmod_legacy_ns)
 
 
@@ -37,7 +37,7 @@ looking up the amino acid sequence.
 
 import logging
 
-from pyparsing import ParserElement, pyparsing_common as ppc
+from pyparsing import Optional, ParserElement, pyparsing_common as ppc
 
 from .constants import amino_acid
 from ..utils import nest, one_of_tags
@@ -56,25 +56,19 @@ AMINO_ACID = 'aminoacid'
 
 def get_truncation_language() -> ParserElement:
     """Build a parser for protein truncations."""
-    l1 = truncation_tag + nest(amino_acid(AMINO_ACID) + ppc.integer(TRUNCATION_POSITION))
-    l1.setParseAction(_handle_trunc)
-    l2 = truncation_tag + nest(ppc.integer(TRUNCATION_POSITION))
-    l2.setParseAction(_handle_trunc_legacy)
-    return l1 | l2
-
-
-def _handle_trunc_legacy(line, _, tokens):
-    # FIXME this isn't correct HGVS nomenclature, but truncation isn't forward compatible without more information
-    upgraded = 'p.{}*'.format(tokens[TRUNCATION_POSITION])
-    logger.warning('trunc() is deprecated. Re-encode with reference terminal amino acid in HGVS: %s', line)
-    tokens[HGVS] = upgraded
-    del tokens[TRUNCATION_POSITION]
-    return tokens
-
-
-def _handle_trunc(_, __, tokens):
-    aa, position = tokens[AMINO_ACID], tokens[TRUNCATION_POSITION]
-    tokens[HGVS] = 'p.{aa}{position}*'.format(aa=aa, position=position)
-    del tokens[AMINO_ACID]
+    language = truncation_tag + nest(Optional(amino_acid(AMINO_ACID)) + ppc.integer(TRUNCATION_POSITION))
+    language.setParseAction(_handle_trunc)
+    return language
+
+
+def _handle_trunc(line, _, tokens):
+    position = tokens[TRUNCATION_POSITION]
+    if AMINO_ACID in tokens:
+        tokens[HGVS] = 'p.{aa}{position}*'.format(aa=tokens[AMINO_ACID], position=position)
+        del tokens[AMINO_ACID]
+    else:
+        # FIXME this isn't correct HGVS nomenclature, but truncation isn't forward compatible without more information
+        logger.warning('trunc() is deprecated. Re-encode with reference terminal amino acid in HGVS: %s', line)
+        tokens[HGVS] = 'p.{}*'.format(position)
     del tokens[TRUNCATION_POSITION]
     return tokens
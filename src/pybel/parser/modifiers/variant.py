@@ -42,21 +42,29 @@ Either way, the resulting object can be used like a dict that looks like:
     - PyBEL module :py:class:`pybel.parser.modifiers.get_hgvs_language`
 """
 
-from pyparsing import ParserElement, Word, alphanums
+from pyparsing import ParseResults, ParserElement, Regex
 
-from ..utils import nest, one_of_tags, quote
+from ..utils import _named_results, quoted_group
 from ...constants import HGVS, KIND
 
 __all__ = [
     'get_hgvs_language',
 ]
 
-variant_tags = one_of_tags(tags=['var', 'variant'], canonical_tag=HGVS, name=KIND)
-variant_characters = Word(alphanums + '._*=?>')
+#: Matches a whole variant, like ``var(p.Ala127Tyr)`` or ``variant("p.Ala127Tyr")``, with either a bare or a quoted
+#: HGVS string
+_VARIANT_RE = r'(?:variant|var)\s*\(\s*(?:(?P<hgvs>[A-Za-z0-9._*=?>]+)|{})\s*\)'.format(quoted_group('quoted_hgvs'))
+
+
+def _handle_variant_match(tokens: ParseResults) -> ParseResults:
+    """Convert the groups matched by a variant's regular expression to named tokens."""
+    value = tokens['hgvs']
+    if value is None:
+        value = tokens['quoted_hgvs']
+
+    return _named_results([(KIND, HGVS), (HGVS, value)])
 
 
 def get_hgvs_language() -> ParserElement:
     """Build a HGVS :class:`pyparsing.ParseElement`."""
-    hgvs = (variant_characters | quote)(HGVS)
-    language = variant_tags + nest(hgvs)
-    return language
+    return Regex(_VARIANT_RE).setName('variant').setParseAction(_handle_variant_match)
@@ -7,11 +7,12 @@ This module handles parsing BEL relations and validation of semantics.
 
 import itertools as itt
 import logging
+import re
 from typing import Dict, List, Mapping, Optional, Pattern, Set, Union
 
 import pyparsing
 from pyparsing import (
-    Group, Keyword, MatchFirst, ParseResults, StringEnd, Suppress, delimitedList, oneOf, replaceWith,
+    Group, Keyword, MatchFirst, ParseResults, StringEnd, Suppress, delimitedList, replaceWith,
 )
 
 from .baseparser import BaseParser
@@ -27,15 +28,16 @@ from .modifiers import (
 )
 from .parse_concept import ConceptParser
 from .parse_control import ControlParser
-from .utils import WCW, nest, one_of_tags, triple
+from .utils import WCW, handle_default_namespace, nest, one_of_keywords, one_of_tags, triple
 from .. import language
 from ..constants import (
-    ABUNDANCE, ACTIVITY, ASSOCIATION, BEL_DEFAULT_NAMESPACE, BINDS, BIOPROCESS, CAUSES_NO_CHANGE, CELL_SECRETION,
-    CELL_SURFACE_EXPRESSION, COMPLEX, COMPOSITE, CONCEPT, CORRELATION, DECREASES, DEGRADATION, DIRECTLY_DECREASES,
-    DIRECTLY_INCREASES, DIRTY, EFFECT, EQUIVALENT_TO, FROM_LOC, FUNCTION, FUSION, GENE, INCREASES, IS_A, LINE, LOCATION,
-    MEMBERS, MIRNA, MODIFIER, NAME, NAMESPACE, NEGATIVE_CORRELATION, NO_CORRELATION, OBJECT, PART_OF, PATHOLOGY,
-    POPULATION, POSITIVE_CORRELATION, PRODUCTS, PROTEIN, REACTANTS, REACTION, REGULATES, RELATION, RNA, SUBJECT, TARGET,
-    TO_LOC, TRANSCRIBED_TO, TRANSLATED_TO, TRANSLOCATION, TWO_WAY_RELATIONS, VARIANTS, belns_encodings,
+    ABUNDANCE, ACTIVITY, ASSOCIATION, BEL_DEFAULT_NAMESPACE, BEL_KEYWORD_SET, BEL_KEYWORD_UNSET, BINDS, BIOPROCESS,
+    CAUSES_NO_CHANGE, CELL_SECRETION, CELL_SURFACE_EXPRESSION, COMPLEX, COMPOSITE, CONCEPT, CORRELATION, DECREASES,
+    DEGRADATION, DIRECTLY_DECREASES, DIRECTLY_INCREASES, DIRTY, EFFECT, EQUIVALENT_TO, FROM_LOC, FUNCTION, FUSION,
+    GENE, INCREASES, IS_A, LINE, LOCATION, MEMBERS, MIRNA, MODIFIER, NAME, NAMESPACE, NEGATIVE_CORRELATION,
+    NO_CORRELATION, OBJECT, PART_OF, PATHOLOGY, POPULATION, POSITIVE_CORRELATION, PRODUCTS, PROTEIN, REACTANTS,
+    REACTION, REGULATES, RELATION, RNA, SUBJECT, TARGET, TO_LOC, TRANSCRIBED_TO, TRANSLATED_TO, TRANSLOCATION,
+    TWO_WAY_RELATIONS, VARIANTS, belns_encodings,
 )
 from ..dsl import BaseEntity, cell_surface_expression, secretion
 from ..tokens import parse_result_to_dsl
@@ -116,7 +118,16 @@ population_tag = one_of_tags(['pop', 'populationAbundance'], POPULATION, FUNCTIO
 activity_tag = one_of_tags(['act', 'activity'], ACTIVITY, MODIFIER)
 
 #: 2.4.1 http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#XmolecularA
-molecular_activity_tags = Suppress(oneOf(['ma', 'molecularActivity']))
+molecular_activity_tags = Suppress(one_of_keywords(['ma', 'molecularActivity']))
+
+# 2.4 Process Modifier Function
+# backwards compatibility with BEL v1.0
+molecular_activity_default = one_of_keywords(language.activity_labels).setParseAction(
+    handle_default_namespace(language.activity_labels),
+)
+
+#: Legacy BEL 1.0 activities like ``kin(p(HGNC:AKT1))``
+activity_legacy_tags = one_of_keywords(language.activities)(MODIFIER)
 
 ################################
 # 2.5 Transformation Functions #
@@ -142,7 +153,7 @@ reaction_tags = one_of_tags(['reaction', 'rxn'], REACTION, FUNCTION)
 #####################
 
 #: `3.1.1 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#Xincreases>`_
-increases_tag = oneOf(['->', '→', 'increases']).setParseAction(replaceWith(INCREASES))
+increases_tag = one_of_keywords(['->', '→', 'increases']).setParseAction(replaceWith(INCREASES))
 
 #: `3.1.2 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#XdIncreases>`_
 directly_increases_tag = one_of_tags(['=>', '⇒', 'directlyIncreases'], DIRECTLY_INCREASES)
@@ -184,10 +195,10 @@ association_tag = one_of_tags(['--', 'association'], ASSOCIATION)
 orthologous_tag = Keyword('orthologous')
 
 #: `3.3.2 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#_transcribedto>`_
-transcribed_tag = oneOf([':>', 'transcribedTo']).setParseAction(replaceWith(TRANSCRIBED_TO))
+transcribed_tag = one_of_keywords([':>', 'transcribedTo']).setParseAction(replaceWith(TRANSCRIBED_TO))
 
 #: `3.3.3 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#_translatedto>`_
-translated_tag = oneOf(['>>', 'translatedTo']).setParseAction(replaceWith(TRANSLATED_TO))
+translated_tag = one_of_keywords(['>>', 'translatedTo']).setParseAction(replaceWith(TRANSLATED_TO))
 
 #: `3.4.1 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#_hasmember>`_
 has_member_tag = Keyword('hasMember')
@@ -230,6 +241,9 @@ equivalent_tag = one_of_tags(['eq', EQUIVALENT_TO], EQUIVALENT_TO)
 #: The ``partOf`` relationship has been proposed for BEL 2.0.0+
 partof_tag = Keyword(PART_OF)
 
+#: Matches the keyword that starts a control statement
+_CONTROL_KEYWORD_RE = re.compile(r'\s*(?:{}|{})\b'.format(BEL_KEYWORD_SET, BEL_KEYWORD_UNSET))
+
 
 class BELParser(BaseParser):
     """Build a parser backed by a given dictionary of namespaces."""
@@ -385,26 +399,33 @@ class BELParser(BaseParser):
             ]) + opt_location,
         )
 
+        # The tags of the alternatives are all distinct keywords, so their order doesn't change what's matched, only
+        # how many alternatives are tried first
         self.single_abundance = MatchFirst([
-            self.general_abundance,
-            self.gene,
-            self.mirna,
             self.protein,
+            self.gene,
             self.rna,
+            self.general_abundance,
+            self.mirna,
         ])
 
         #: `2.1.2 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#XcomplexA>`_
         self.complex_singleton = complex_tag + nest(concept + opt_location)
 
-        self.complex_list = complex_tag + nest(
-            delimitedList(Group(self.single_abundance | self.complex_singleton))(MEMBERS) + opt_location,
+        # The list and singleton forms share the ``complex(`` prefix, so it's only scanned once
+        self.complex_abundances = complex_tag + nest(
+            MatchFirst([
+                delimitedList(Group(self.single_abundance | self.complex_singleton))(MEMBERS),
+                concept,
+            ]) + opt_location,
         )
 
-        self.complex_abundances = self.complex_list | self.complex_singleton
-
         # Definition of all simple abundances that can be used in a composite abundance
-        self.simple_abundance = self.complex_abundances | self.single_abundance
-        self.simple_abundance.setParseAction(self.check_function_semantics)
+        self.simple_abundance = self.single_abundance | self.complex_abundances
+        # Function semantics can only be checked against enumerated namespaces, so there's no need
+        # for a parse action on every abundance when there aren't any
+        if self._namespace_dict:
+            self.simple_abundance.setParseAction(self.check_function_semantics)
 
         #: `2.1.3 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#XcompositeA>`_
         self.composite_abundance = composite_abundance_tag + nest(
@@ -413,13 +434,6 @@ class BELParser(BaseParser):
 
         self.abundance = self.simple_abundance | self.composite_abundance
 
-        # 2.4 Process Modifier Function
-        # backwards compatibility with BEL v1.0
-
-        molecular_activity_default = oneOf(list(language.activity_labels)).setParseAction(
-            handle_molecular_activity_default,
-        )
-
         #: `2.4.1 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#XmolecularA>`_
         self.molecular_activity = molecular_activity_tags + nest(
             molecular_activity_default | self.concept_parser.language,
@@ -436,13 +450,13 @@ class BELParser(BaseParser):
         self.population = population_tag + nest(concept)
 
         self.bp_path = self.biological_process | self.pathology | self.population
-        self.bp_path.setParseAction(self.check_function_semantics)
+        if self._namespace_dict:
+            self.bp_path.setParseAction(self.check_function_semantics)
 
         self.activity_standard = activity_tag + nest(
             Group(self.simple_abundance)(TARGET) + pyparsing.Optional(WCW + Group(self.molecular_activity)(EFFECT)),
         )
 
-        activity_legacy_tags = oneOf(language.activities)(MODIFIER)
         self.activity_legacy = activity_legacy_tags + nest(Group(self.simple_abundance)(TARGET))
         self.activity_legacy.setParseAction(handle_activity_legacy)
 
@@ -460,30 +474,18 @@ class BELParser(BaseParser):
 
         self.cell_surface_expression = cell_surface_expression_tag + nest(Group(self.simple_abundance)(TARGET))
 
-        self.translocation_standard = nest(
-            Group(self.simple_abundance)(TARGET)
-            + WCW
-            + Group(from_loc + WCW + to_loc)(EFFECT),
-        )
+        translocation_standard = Group(from_loc + WCW + to_loc)(EFFECT)
+        translocation_legacy = Group(concept(FROM_LOC) + WCW + concept(TO_LOC))(EFFECT)
+        translocation_legacy.addParseAction(handle_legacy_tloc)
 
-        self.translocation_legacy = nest(
+        #: `2.5.1 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#_translocations>`_
+        self.translocation = translocation_tag + nest(
             Group(self.simple_abundance)(TARGET)
-            + WCW
-            + Group(concept(FROM_LOC) + WCW + concept(TO_LOC))(EFFECT),
+            + pyparsing.Optional(WCW + MatchFirst([translocation_standard, translocation_legacy])),
         )
 
-        self.translocation_legacy.addParseAction(handle_legacy_tloc)
-        self.translocation_unqualified = nest(Group(self.simple_abundance)(TARGET))
-
         if self.disallow_unqualified_translocations:
-            self.translocation_unqualified.setParseAction(self.handle_translocation_illegal)
-
-        #: `2.5.1 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#_translocations>`_
-        self.translocation = translocation_tag + MatchFirst([
-            self.translocation_unqualified,
-            self.translocation_standard,
-            self.translocation_legacy,
-        ])
+            self.translocation.addParseAction(self.handle_translocation_illegal)
 
         #: `2.5.2 <http://openbel.org/language/version_2.0/bel_specification_version_2.0.html#_degradation_deg>`_
         self.degradation = degradation_tags + nest(Group(self.simple_abundance)(TARGET))
@@ -504,26 +506,26 @@ class BELParser(BaseParser):
 
         # 3 BEL Relationships
 
-        self.bel_term = MatchFirst([self.transformation, self.process, self.abundance]).streamline()
+        self.bel_term = MatchFirst([self.abundance, self.process, self.transformation]).streamline()
 
         self.bel_to_bel_relations = [
-            association_tag,
             increases_tag,
             decreases_tag,
+            directly_increases_tag,
+            directly_decreases_tag,
+            association_tag,
             positive_correlation_tag,
             negative_correlation_tag,
+            regulates_tag,
+            causes_no_change_tag,
             correlation_tag,
             no_correlation_tag,
             binds_tag,
-            causes_no_change_tag,
-            orthologous_tag,
             is_a_tag,
-            equivalent_tag,
             partof_tag,
-            directly_increases_tag,
-            directly_decreases_tag,
+            equivalent_tag,
+            orthologous_tag,
             analogous_tag,
-            regulates_tag,
         ]
         self.bel_to_bel = triple(self.bel_term, MatchFirst(self.bel_to_bel_relations), self.bel_term)
 
@@ -655,6 +657,19 @@ class BELParser(BaseParser):
         self.graph.clear()
         self.control_parser.clear()
 
+    def parseString(self, line: str, line_number: int = 0) -> ParseResults:  # noqa: N802
+        """Parse a line of BEL.
+
+        Only control statements start with ``SET`` or ``UNSET``, so they're sent straight to the control parser and
+        everything else straight to the statement grammar without trying the other first.
+        """
+        self._line_number = line_number
+
+        if _CONTROL_KEYWORD_RE.match(line):
+            return self.control_parser.parseString(line, line_number=line_number)
+
+        return self.statement.parseString(line)
+
     def handle_nested_relation(self, line: str, position: int, tokens: ParseResults):
         """Handle nested statements.
 
@@ -750,22 +765,19 @@ class BELParser(BaseParser):
 
     def _add_qualified_edge_helper(self, *, u, u_modifier, relation, v, v_modifier, annotations) -> str:
         """Add a qualified edge from the internal aspects of the parser."""
-        m = {
-            BINDS: self.graph.add_binds,
-        }
-        adder = m.get(relation)
+        control_parser = self.control_parser
         d = dict(
-            evidence=self.control_parser.evidence,
-            citation=self.control_parser.get_citation(),
+            evidence=control_parser.evidence,
+            citation=control_parser.get_citation(),
             annotations=annotations,
             subject_modifier=u_modifier,
             object_modifier=v_modifier,
             **{LINE: self.get_line_number()},
         )
-        if adder is not None:
-            return adder(u=u, v=v, **d)
-        else:
-            return self.graph.add_qualified_edge(u=u, v=v, relation=relation, **d)
+        graph = self.graph
+        if relation == BINDS:
+            return graph.add_binds(u=u, v=v, **d)
+        return graph.add_qualified_edge(u=u, v=v, relation=relation, **d)
 
     def _add_qualified_edge(self, *, u, u_modifier, relation, v, v_modifier, annotations) -> str:
         """Add an edge, then adds the opposite direction edge if it should."""
@@ -779,13 +791,17 @@ class BELParser(BaseParser):
 
     def _handle_relation(self, tokens: ParseResults) -> str:
         """Handle a relation."""
-        u = self.ensure_node(tokens[SUBJECT])
-        u_modifier = modifier_po_to_dict(tokens[SUBJECT])
+        ensure_node = self.ensure_node
+        subject, obj = tokens[SUBJECT], tokens[OBJECT]
+        u = ensure_node(subject)
+        u_modifier = modifier_po_to_dict(subject)
         relation = tokens[RELATION]
-        v = self.ensure_node(tokens[OBJECT])
-        v_modifier = modifier_po_to_dict(tokens[OBJECT])
+        v = ensure_node(obj)
+        v_modifier = modifier_po_to_dict(obj)
 
-        annotations = self._get_prepared_annotations()
+        # The graph converts the annotations to its own format with fresh dictionaries for each edge, so there's
+        # no need to copy or convert them here
+        annotations = self.control_parser.annotations
 
         return self._add_qualified_edge(
             u=u, u_modifier=u_modifier,
@@ -794,21 +810,6 @@ class BELParser(BaseParser):
             annotations=annotations,
         )
 
-    def _get_prepared_annotations(self):
-        return {
-            annotation_name: (
-                {
-                    ae: True
-                    for ae in annotation_entry
-                }
-                if isinstance(annotation_entry, set) else
-                {
-                    annotation_entry: True,
-                }
-            )
-            for annotation_name, annotation_entry in self.control_parser.annotations.items()
-        }
-
     def _handle_relation_harness(self, line: str, position: int, tokens: Union[ParseResults, Dict]) -> ParseResults:
         """Handle BEL relations based on the policy specified on instantiation.
 
@@ -818,13 +819,14 @@ class BELParser(BaseParser):
         return tokens
 
     def _handle_relation_checked(self, line, position, tokens):
-        if not self.control_parser.citation_is_set:
+        control_parser = self.control_parser
+        if not control_parser.citation_is_set:
             raise MissingCitationException(self.get_line_number(), line, position)
 
-        if not self.control_parser.evidence:
+        if not control_parser.evidence:
             raise MissingSupportWarning(self.get_line_number(), line, position)
 
-        missing_required_annotations = self.control_parser.get_missing_required_annotations()
+        missing_required_annotations = control_parser.get_missing_required_annotations()
         if missing_required_annotations:
             raise MissingAnnotationWarning(self.get_line_number(), line, position, missing_required_annotations)
 
@@ -848,6 +850,7 @@ class BELParser(BaseParser):
 
     def ensure_node(self, tokens: ParseResults) -> BaseEntity:
         """Turn parsed tokens into canonical node name and makes sure its in the graph."""
+        # Modified terms, like activities and translocations, are nodes for their target
         if MODIFIER in tokens:
             return self.ensure_node(tokens[TARGET])
 
@@ -856,20 +859,14 @@ class BELParser(BaseParser):
         return node
 
     def handle_translocation_illegal(self, line: str, position: int, tokens: ParseResults) -> None:
-        """Handle a malformed translocation."""
+        """Handle a malformed translocation that lacks its ``fromLoc`` and ``toLoc`` entries."""
+        if EFFECT in tokens:
+            return
         raise MalformedTranslocationWarning(self.get_line_number(), line, position, tokens)
 
 
 # HANDLERS
 
-def handle_molecular_activity_default(_: str, __: int, tokens: ParseResults) -> ParseResults:
-    """Handle a BEL 2.0 style molecular activity with BEL default names."""
-    upgraded = language.activity_labels[tokens[0]]
-    tokens[NAMESPACE] = BEL_DEFAULT_NAMESPACE
-    tokens[NAME] = upgraded
-    return tokens
-
-
 def handle_activity_legacy(_: str, __: int, tokens: ParseResults) -> ParseResults:
     """Handle BEL 1.0 activities."""
     legacy_cls = language.activity_labels[tokens[MODIFIER]]
@@ -902,31 +899,34 @@ def modifier_po_to_dict(tokens):
     if MODIFIER not in tokens:
         return attrs
 
-    if LOCATION in tokens[TARGET]:
-        attrs[LOCATION] = tokens[TARGET][LOCATION].asDict()
+    target = tokens[TARGET]
+    if LOCATION in target:
+        attrs[LOCATION] = target[LOCATION].asDict()
+
+    modifier = tokens[MODIFIER]
 
-    if tokens[MODIFIER] == DEGRADATION:
-        attrs[MODIFIER] = tokens[MODIFIER]
+    if modifier == DEGRADATION:
+        attrs[MODIFIER] = modifier
 
-    elif tokens[MODIFIER] == ACTIVITY:
-        attrs[MODIFIER] = tokens[MODIFIER]
+    elif modifier == ACTIVITY:
+        attrs[MODIFIER] = modifier
 
         if EFFECT in tokens:
             attrs[EFFECT] = dict(tokens[EFFECT])
 
-    elif tokens[MODIFIER] == TRANSLOCATION:
-        attrs[MODIFIER] = tokens[MODIFIER]
+    elif modifier == TRANSLOCATION:
+        attrs[MODIFIER] = modifier
 
         if EFFECT in tokens:
             attrs[EFFECT] = tokens[EFFECT].asDict()
 
-    elif tokens[MODIFIER] == CELL_SECRETION:
+    elif modifier == CELL_SECRETION:
         attrs.update(secretion())
 
-    elif tokens[MODIFIER] == CELL_SURFACE_EXPRESSION:
+    elif modifier == CELL_SURFACE_EXPRESSION:
         attrs.update(cell_surface_expression())
 
     else:
-        raise ValueError('Invalid value for tokens[MODIFIER]: {}'.format(tokens[MODIFIER]))
+        raise ValueError('Invalid value for tokens[MODIFIER]: {}'.format(modifier))
 
     return attrs
@@ -3,10 +3,11 @@
 """A module holding the :class:`IdentifierParser`."""
 
 import logging
+import sys
 from collections import defaultdict
 from typing import Mapping, Optional, Pattern, Set
 
-from pyparsing import ParseResults, Suppress
+from pyparsing import ParseResults, Regex
 
 from .baseparser import BaseParser
 from .constants import NamespaceTermEncodingMapping
@@ -14,7 +15,7 @@ from .exc import (
     MissingDefaultNameWarning, MissingNamespaceNameWarning, MissingNamespaceRegexWarning, NakedNameWarning,
     UndefinedNamespaceWarning,
 )
-from .utils import quote, word
+from .utils import _named_results, quote, quoted_group, word
 from ..constants import DIRTY, IDENTIFIER, NAME, NAMESPACE
 
 __all__ = [
@@ -23,6 +24,23 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+#: A regular expression for a namespace prefix, like ``HGNC`` in ``HGNC:AKT1``
+_NAMESPACE_RE = r'(?P<{}>[A-Za-z0-9]+)'.format(NAMESPACE)
+
+_QUOTED_PREFIX = 'quoted_'
+
+
+def _word_or_quote_re(key: str) -> str:
+    """Build a regular expression for an alphanumeric word or a double-quoted string for the given key."""
+    return r'(?:(?P<{}>[A-Za-z0-9]+)|{})'.format(key, quoted_group(_QUOTED_PREFIX + key))
+
+
+#: Matches ``namespace:name``
+_QUALIFIED_RE = r'{}\s*:\s*{}'.format(_NAMESPACE_RE, _word_or_quote_re(NAME))
+
+#: Matches ``namespace:identifier!name``
+_FQUALIFIED_RE = r'{}\s*:\s*{}\s*!\s*{}'.format(_NAMESPACE_RE, _word_or_quote_re(IDENTIFIER), _word_or_quote_re(NAME))
+
 
 class ConceptParser(BaseParser):
     """A parser for concepts in the form of ``namespace:name`` or ``namespace:identifier!name``.
@@ -44,14 +62,8 @@ class ConceptParser(BaseParser):
         :param default_namespace: A set of strings that can be used without a namespace
         :param allow_naked_names: If true, turn off naked namespace failures
         """
-        self.identifier_fqualified = (
-            word(NAMESPACE)
-            + Suppress(':')
-            + (word | quote)(IDENTIFIER)
-            + Suppress('!')
-            + (word | quote)(NAME)
-        )
-        self.identifier_qualified = word(NAMESPACE) + Suppress(':') + (word | quote)(NAME)
+        self.identifier_fqualified = Regex(_FQUALIFIED_RE).setParseAction(_handle_qualified_match)
+        self.identifier_qualified = Regex(_QUALIFIED_RE).setParseAction(_handle_qualified_match)
 
         if namespace_to_term_to_encoding is not None:
             self.namespace_to_name_to_encoding = defaultdict(dict)
@@ -64,8 +76,8 @@ class ConceptParser(BaseParser):
             self.namespace_to_name_to_encoding = dict(self.namespace_to_name_to_encoding)
             self.namespace_to_identifier_to_encoding = dict(self.namespace_to_identifier_to_encoding)
 
-            self.identifier_fqualified.setParseAction(self.handle_identifier_qualified)
-            self.identifier_qualified.setParseAction(self.handle_identifier_qualified)
+            self.identifier_fqualified.addParseAction(self.handle_identifier_qualified)
+            self.identifier_qualified.addParseAction(self.handle_identifier_qualified)
         else:
             self.namespace_to_name_to_encoding = {}
             self.namespace_to_identifier_to_encoding = {}
@@ -119,10 +131,12 @@ class ConceptParser(BaseParser):
         """Raise an exception if the namespace is not defined or if it does not validate the given name."""
         self.raise_for_missing_namespace(line, position, namespace, name)
 
-        if self.has_enumerated_namespace(namespace) and not self.has_enumerated_namespace_name(namespace, name):
+        name_to_encoding = self.namespace_to_name_to_encoding.get(namespace)
+        if name_to_encoding is not None and name not in name_to_encoding:
             raise MissingNamespaceNameWarning(self.get_line_number(), line, position, namespace, name)
 
-        if self.has_regex_namespace(namespace) and not self.has_regex_namespace_name(namespace, name):
+        pattern = self.namespace_to_pattern.get(namespace)
+        if pattern is not None and not pattern.match(name):
             raise MissingNamespaceRegexWarning(self.get_line_number(), line, position, namespace, name)
 
     def raise_for_missing_default(self, line: str, position: int, name: str) -> None:
@@ -136,8 +150,6 @@ class ConceptParser(BaseParser):
     def handle_identifier_qualified(self, line: str, position: int, tokens: ParseResults) -> ParseResults:
         """Handle parsing a qualified identifier."""
         namespace, name = tokens[NAMESPACE], tokens[NAME]
-
-        self.raise_for_missing_namespace(line, position, namespace, name)
         self.raise_for_missing_name(line, position, namespace, name)
 
         return tokens
@@ -159,3 +171,17 @@ class ConceptParser(BaseParser):
         """Raise an exception when parsing a name missing a namespace."""
         name = tokens[NAME]
         raise NakedNameWarning(self.get_line_number(), line, position, name)
+
+
+def _handle_qualified_match(tokens: ParseResults) -> ParseResults:
+    """Convert the groups matched by a qualified identifier's regular expression to named tokens.
+
+    Namespaces are interned because the same few are repeated throughout a document and are used for
+    dictionary lookups during validation and in every node built from them.
+    """
+    pairs = [(NAMESPACE, sys.intern(tokens[NAMESPACE]))]
+    for key in (IDENTIFIER, NAME):
+        if key in tokens:
+            value = tokens[key]
+            pairs.append((key, value if value is not None else tokens[_QUOTED_PREFIX + key]))
+    return _named_results(pairs)
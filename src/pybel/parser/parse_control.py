@@ -10,9 +10,11 @@ This module handles parsing control statement, which add annotations and namespa
 """
 
 import logging
+import re
+import sys
 from typing import Dict, List, Mapping, Optional, Pattern, Set
 
-from pyparsing import And, MatchFirst, ParseResults, Suppress, oneOf, pyparsing_common as ppc
+from pyparsing import And, MatchFirst, ParseResults, Regex, Suppress, pyparsing_common as ppc
 
 from .baseparser import BaseParser
 from .exc import (
@@ -20,7 +22,10 @@ from .exc import (
     InvalidPubMedIdentifierWarning, MissingAnnotationKeyWarning, MissingAnnotationRegexWarning,
     MissingCitationException, UndefinedAnnotationWarning,
 )
-from .utils import delimited_quoted_list, delimited_unquoted_list, is_int, qid, quote
+from .utils import (
+    QUOTED_RE, _named_results, delimited_quoted_list, delimited_unquoted_list, is_int, one_of_keywords, qid, quote,
+    quoted_group,
+)
 from ..constants import (
     ANNOTATIONS, BEL_KEYWORD_ALL, BEL_KEYWORD_CITATION, BEL_KEYWORD_EVIDENCE, BEL_KEYWORD_SET,
     BEL_KEYWORD_STATEMENT_GROUP, BEL_KEYWORD_SUPPORT, BEL_KEYWORD_UNSET, CITATION, CITATION_TYPES, CITATION_TYPE_PUBMED,
@@ -36,12 +41,47 @@ set_tag = Suppress(BEL_KEYWORD_SET)
 unset_tag = Suppress(BEL_KEYWORD_UNSET)
 unset_all = Suppress(BEL_KEYWORD_ALL)
 
-supporting_text_tags = oneOf([BEL_KEYWORD_EVIDENCE, BEL_KEYWORD_SUPPORT])
+supporting_text_tags = one_of_keywords([BEL_KEYWORD_EVIDENCE, BEL_KEYWORD_SUPPORT])
 
 set_statement_group_stub = And([Suppress(BEL_KEYWORD_STATEMENT_GROUP), Suppress('='), qid('group')])
-set_citation_stub = And([Suppress(BEL_KEYWORD_CITATION), Suppress('='), delimited_quoted_list('values')])
 set_evidence_stub = And([Suppress(supporting_text_tags), Suppress('='), quote('value')])
 
+#: Matches a string enclosed in double quotes, capturing its contents
+_QUOTED = re.compile(quoted_group())
+
+#: Matches the ``Citation = {"X", "Y", ...}`` in a ``SET Citation`` statement. Its values are pulled out with
+#: :data:`_QUOTED`.
+_SET_CITATION_RE = r'{keyword}\s*=\s*\{{\s*(?P<values>{quoted}(?:\s*,\s*{quoted})*)\s*\}}'.format(
+    keyword=BEL_KEYWORD_CITATION,
+    quoted=QUOTED_RE,
+)
+
+
+def _handle_set_citation_match(tokens: ParseResults) -> ParseResults:
+    """Convert the list matched by a ``SET Citation`` statement's regular expression to named tokens."""
+    return _named_results([('values', _QUOTED.findall(tokens['values']))])
+
+
+set_citation_stub = Regex(_SET_CITATION_RE).setName('citation').setParseAction(_handle_set_citation_match)
+
+#: Matches the ``X = "Y"`` or ``X = Y`` in a ``SET`` statement. Lists of values, like ``SET X = {"Y", "Z"}``, don't
+#: match and fall through to :data:`delimited_quoted_list`.
+_SET_COMMAND_RE = r'(?P<key>[A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:{}|(?P<identifier>[A-Za-z0-9_]+))'.format(
+    quoted_group('quoted'),
+)
+
+
+def _handle_set_command_match(tokens: ParseResults) -> ParseResults:
+    """Convert the groups matched by a ``SET X = "Y"`` statement's regular expression to named tokens."""
+    key, value = tokens['key'], tokens['quoted']
+    if value is None:
+        value = tokens['identifier']
+
+    return _named_results([('key', key), ('value', value)])
+
+
+set_command_stub = Regex(_SET_COMMAND_RE).setName('annotation').setParseAction(_handle_set_command_match)
+
 
 class ControlParser(BaseParser):
     """A parser for BEL control statements.
@@ -83,14 +123,15 @@ class ControlParser(BaseParser):
 
         annotation_key = ppc.identifier('key').setParseAction(self.handle_annotation_key)
 
+        # The grammar can't be shared between parsers since its parse actions are bound to this parser's state, so
+        # each module-level stub is copied before getting its parse action
         self.set_statement_group = set_statement_group_stub().setParseAction(self.handle_set_statement_group)
-        self.set_citation = set_citation_stub.setParseAction(self.handle_set_citation)
-        self.set_evidence = set_evidence_stub.setParseAction(self.handle_set_evidence)
+        self.set_citation = set_citation_stub().addParseAction(self.handle_set_citation)
+        self.set_evidence = set_evidence_stub().setParseAction(self.handle_set_evidence)
 
-        set_command_prefix = And([annotation_key('key'), Suppress('=')])
-        self.set_command = set_command_prefix + qid('value')
-        self.set_command.setParseAction(self.handle_set_command)
+        self.set_command = set_command_stub().addParseAction(self.handle_annotation_key, self.handle_set_command)
 
+        set_command_prefix = And([annotation_key('key'), Suppress('=')])
         self.set_command_list = set_command_prefix + delimited_quoted_list('values')
         self.set_command_list.setParseAction(self.handle_set_command_list)
 
@@ -109,7 +150,7 @@ class ControlParser(BaseParser):
         self.unset_list = delimited_unquoted_list('values')
         self.unset_list.setParseAction(self.handle_unset_list)
 
-        self.unset_all = unset_all.setParseAction(self.handle_unset_all)
+        self.unset_all = unset_all().setParseAction(self.handle_unset_all)
 
         self.set_statements = set_tag + MatchFirst([
             self.set_statement_group,
@@ -156,9 +197,9 @@ class ControlParser(BaseParser):
     def has_annotation(self, annotation: str) -> bool:
         """Check if the annotation is defined."""
         return (
-            self.has_enumerated_annotation(annotation)
-            or self.has_regex_annotation(annotation)
-            or self.has_local_annotation(annotation)
+            annotation in self.annotation_to_term
+            or annotation in self.annotation_to_pattern
+            or annotation in self.annotation_to_local
         )
 
     def raise_for_undefined_annotation(self, line: str, position: int, annotation: str) -> None:
@@ -180,13 +221,17 @@ class ControlParser(BaseParser):
         if self._in_debug_mode:
             return
 
-        if self.has_enumerated_annotation(key) and value not in self.annotation_to_term[key]:
+        terms = self.annotation_to_term.get(key)
+        pattern = self.annotation_to_pattern.get(key)
+        local_terms = self.annotation_to_local.get(key)
+
+        if terms is not None and value not in terms:
             raise IllegalAnnotationValueWarning(self.get_line_number(), line, position, key, value)
 
-        elif self.has_regex_annotation(key) and not self.annotation_to_pattern[key].match(value):
+        elif pattern is not None and not pattern.match(value):
             raise MissingAnnotationRegexWarning(self.get_line_number(), line, position, key, value)
 
-        elif self.has_local_annotation(key) and value not in self.annotation_to_local[key]:  # TODO condense
+        elif local_terms is not None and value not in local_terms:  # TODO condense
             raise IllegalAnnotationValueWarning(self.get_line_number(), line, position, key, value)
 
     def raise_for_missing_citation(self, line: str, position: int) -> None:
@@ -254,14 +299,16 @@ class ControlParser(BaseParser):
 
     def handle_set_command(self, line: str, position: int, tokens: ParseResults) -> ParseResults:
         """Handle a ``SET X = "Y"`` statement."""
-        key, value = tokens['key'], tokens['value']
+        # Annotations are copied to every edge until they're unset, and the same keys and values are set over and
+        # over again in a document, so intern them to share one copy of each
+        key, value = sys.intern(tokens['key']), sys.intern(tokens['value'])
         self.raise_for_invalid_annotation_value(line, position, key, value)
         self.annotations[key] = value
         return tokens
 
     def handle_set_command_list(self, line: str, position: int, tokens: ParseResults) -> ParseResults:
         """Handle a ``SET X = {"Y", "Z", ...}`` statement."""
-        key, values = tokens['key'], tokens['values']
+        key, values = sys.intern(tokens['key']), [sys.intern(value) for value in tokens['values']]
         for value in values:
             self.raise_for_invalid_annotation_value(line, position, key, value)
         self.annotations[key] = set(values)
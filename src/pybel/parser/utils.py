@@ -4,14 +4,14 @@
 
 import itertools as itt
 import logging
-from typing import Any, List, Optional
+import re
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
 
 from pyparsing import (
-    And, Group, ParserElement, Suppress, White, Word, ZeroOrMore, alphanums, dblQuotedString, delimitedList, oneOf,
-    removeQuotes, replaceWith,
+    And, Group, ParseResults, ParserElement, Regex, Suppress, Word, alphanums, delimitedList, removeQuotes, replaceWith,
 )
 
-from ..constants import OBJECT, RELATION, SUBJECT
+from ..constants import BEL_DEFAULT_NAMESPACE, NAME, NAMESPACE, OBJECT, RELATION, SUBJECT
 
 logger = logging.getLogger('pybel')
 
@@ -29,16 +29,56 @@ def is_int(s: Any) -> bool:
         return False
 
 
-W = Suppress(ZeroOrMore(White()))
+#: The contents of a double-quoted string. This is the same pattern as :data:`pyparsing.dblQuotedString`
+_QUOTED_CONTENTS_RE = r'(?:[^"\n\r\\]|(?:"")|(?:\\(?:[^x]|x[0-9a-fA-F]+)))*'
+
+#: A regular expression for a double-quoted string. Every regular expression that matches a quoted string should be
+#: built from this one (or from :func:`quoted_group`) so they all follow the same escaping rules.
+QUOTED_RE = '"{}"'.format(_QUOTED_CONTENTS_RE)
+
+
+def quoted_group(name: Optional[str] = None) -> str:
+    """Build a regular expression for a double-quoted string that captures its contents, without the quotes.
+
+    :param name: The name of the group. If none, the group is unnamed.
+    """
+    if name is None:
+        return '"({})"'.format(_QUOTED_CONTENTS_RE)
+    return '"(?P<{}>{})"'.format(name, _QUOTED_CONTENTS_RE)
+
+
+def _named_results(pairs: Iterable[Tuple[str, Any]]) -> ParseResults:
+    """Build parse results from the given values, where each is also accessible by its name.
+
+    Like a named group of several tokens in PyParsing, a value that's a list contributes each of its elements.
+
+    :param pairs: An iterable of (name, value) pairs
+    """
+    pairs = list(pairs)
+    tokens = []
+    for _, value in pairs:
+        if isinstance(value, list):
+            tokens.extend(value)
+        else:
+            tokens.append(value)
+
+    rv = ParseResults(tokens)
+    for name, value in pairs:
+        rv[name] = ParseResults(value) if isinstance(value, list) else value
+    return rv
+
+
 C = Suppress(',')
-WCW = W + C + W
+#: A comma with optional whitespace around it. PyParsing already skips whitespace before every element, so the
+#: whitespace doesn't need to be matched explicitly.
+WCW = C
 LPF, RPF = map(Suppress, '()')
-LP = Suppress('(') + W
-RP = W + Suppress(')')
 
 word = Word(alphanums)
 identifier = Word(alphanums + '_')
-quote = dblQuotedString().setParseAction(removeQuotes)
+#: A double-quoted string with its quotes removed, matched like :data:`pyparsing.dblQuotedString`
+quote = Regex(QUOTED_RE)
+quote.setName('string enclosed in double quotes').setParseAction(removeQuotes)
 qid = quote | identifier
 delimited_quoted_list = And([Suppress('{'), delimitedList(quote), Suppress('}')])
 delimited_unquoted_list = And([Suppress('{'), delimitedList(identifier), Suppress('}')])
@@ -51,6 +91,28 @@ def nest(*content):
     return And([LPF, content[0]] + list(itt.chain.from_iterable(zip(itt.repeat(C), content[1:]))) + [RPF])
 
 
+def _longest_first(tag: str) -> Tuple[int, str]:
+    return -len(tag), tag
+
+
+def one_of_keywords(tags: Iterable[str]) -> ParserElement:
+    """Build a single precompiled regular expression that matches any of the given tags.
+
+    Longer tags are tried first so a tag is never shadowed by one of its prefixes, and tags ending in a word character
+    can't match the beginning of a longer word (e.g., the ``p`` in ``path(...)``), so mismatches are rejected
+    before any further parsing is attempted. Ties are broken alphabetically so the pattern (and the error messages
+    that use its name) don't depend on the order of the given tags.
+
+    :param tags: the strings to match
+    """
+    tags = sorted(set(tags), key=_longest_first)
+    pattern = '|'.join(
+        re.escape(tag) + (r'(?!\w)' if tag[-1].isalnum() else '')
+        for tag in tags
+    )
+    return Regex(pattern).setName(' | '.join(tags))
+
+
 def one_of_tags(
     tags: List[str],
     canonical_tag: str,
@@ -67,7 +129,7 @@ def one_of_tags(
                             (note capitalization) is used for the abundance of a gene
     :param name: this is the key under which the value for this tag is put in the PyParsing framework.
     """
-    element = oneOf(tags).setParseAction(replaceWith(canonical_tag))
+    element = one_of_keywords(tags).setParseAction(replaceWith(canonical_tag))
 
     if name is None:
         return element
@@ -75,6 +137,22 @@ def one_of_tags(
     return element.setResultsName(name)
 
 
+def handle_default_namespace(labels: Mapping[str, str]) -> Callable[[str, int, ParseResults], ParseResults]:
+    """Build a parse action that upgrades a keyword to a concept in the BEL default namespace.
+
+    This is shared by all of the keyword-based concepts, such as ``Ph`` in ``pmod(Ph)`` and ``kin`` in ``ma(kin)``.
+
+    :param labels: A dictionary from the keywords to their names in the BEL default namespace
+    """
+
+    def _handle_default_namespace(_: str, __: int, tokens: ParseResults) -> ParseResults:
+        tokens[NAMESPACE] = BEL_DEFAULT_NAMESPACE
+        tokens[NAME] = labels[tokens[0]]
+        return tokens
+
+    return _handle_default_namespace
+
+
 def triple(subject, relation, obj) -> ParserElement:
     """Build a simple triple in PyParsing that has a ``subject relation object`` format."""
     return And([Group(subject)(SUBJECT), relation(RELATION), Group(obj)(OBJECT)])
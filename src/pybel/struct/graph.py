@@ -353,7 +353,9 @@ class BELGraph(nx.MultiDiGraph):
     def _help_add_edge_helper(self, u: BaseEntity, v: BaseEntity, attr: Mapping) -> str:
         key = hash_edge(u, v, attr)
 
-        if not self.has_edge(u, v, key):
+        # Both nodes were already added, so the adjacency dictionary can be checked directly
+        # without the exception handling in nx.MultiDiGraph.has_edge
+        if key not in self._adj[u].get(v, ()):
             self.add_edge(u, v, key=key, **attr)
 
         return key
@@ -558,23 +560,35 @@ class BELGraph(nx.MultiDiGraph):
         """Add an entity to the graph."""
         assert isinstance(node, BaseEntity)
 
-        if node in self:
+        # Check the node dictionary directly since this is called for both ends of every edge and
+        # BaseEntity objects are always hashable, so the guard in nx.Graph.__contains__ isn't needed
+        if node in self._node:
             return
 
         self.add_node(node)
 
         if VARIANTS in node:
-            self.add_has_variant(node.get_parent(), node)
+            edges = [(node.get_parent(), node, {RELATION: HAS_VARIANT})]
 
         elif MEMBERS in node:
-            for member in node[MEMBERS]:
-                self.add_part_of(member, node)
+            edges = [(member, node, {RELATION: PART_OF}) for member in node[MEMBERS]]
 
         elif PRODUCTS in node and REACTANTS in node:
-            for reactant_tokens in node[REACTANTS]:
-                self.add_has_reactant(node, reactant_tokens)
-            for product_tokens in node[PRODUCTS]:
-                self.add_has_product(node, product_tokens)
+            edges = [(node, reactant, {RELATION: HAS_REACTANT}) for reactant in node[REACTANTS]]
+            edges.extend((node, product, {RELATION: HAS_PRODUCT}) for product in node[PRODUCTS])
+
+        else:
+            return
+
+        # Since the node is new, none of its structural edges can already be in the graph, so
+        # they can be added all at once without checking for duplicates
+        for u, v, _ in edges:
+            self.add_node_from_data(v if u is node else u)
+
+        self.add_edges_from(
+            (u, v, hash_edge(u, v, attr), attr)
+            for u, v, attr in edges
+        )
 
     def _has_edge_attr(self, u: BaseEntity, v: BaseEntity, key: str, attr: Hashable) -> bool:
         assert isinstance(u, BaseEntity)
@@ -7,7 +7,7 @@ A transformation function takes in a :class:`pybel.BELGraph` and either returns
 """
 
 import logging
-from inspect import signature
+from inspect import CO_VARARGS, CO_VARKEYWORDS, ismethod, signature
 
 from .exc import MissingPipelineFunctionError, PipelineNameError
 
@@ -31,11 +31,24 @@ has_arguments_map = {}
 no_arguments_map = {}
 
 
+def _count_parameters(func) -> int:
+    """Count the parameters of a function, like ``len(signature(func).parameters)`` but faster for plain functions."""
+    code = getattr(func, '__code__', None)
+    if code is None or hasattr(func, '__wrapped__') or ismethod(func):
+        return len(signature(func).parameters)
+    return (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & CO_VARARGS)
+        + bool(code.co_flags & CO_VARKEYWORDS)
+    )
+
+
 def _has_arguments(func, universe):
-    sig = signature(func)
+    n_parameters = _count_parameters(func)
     return (
-        (universe and 3 <= len(sig.parameters))
-        or (not universe and 2 <= len(sig.parameters))
+        (universe and 3 <= n_parameters)
+        or (not universe and 2 <= n_parameters)
     )
 
 
@@ -8,8 +8,8 @@ import types
 from functools import wraps
 from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple, Union
 
-from .decorators import get_transformation, in_place_map, mapped, universe_map
-from .exc import MetaValueError, MissingPipelineFunctionError, MissingUniverseError
+from .decorators import get_transformation, in_place_map, universe_map
+from .exc import MetaValueError, MissingUniverseError
 from ..operations import node_intersection, union
 
 __all__ = [
@@ -97,19 +97,13 @@ class Pipeline:
         :rtype: types.FunctionType
         :raises MissingPipelineFunctionError: If the functions is not registered
         """
-        f = mapped.get(name)
-
-        if f is None:
-            raise MissingPipelineFunctionError('{} is not registered as a pipeline function'.format(name))
-
-        if name in universe_map and name in in_place_map:
-            return self._wrap_in_place(self._wrap_universe(f))
+        f = get_transformation(name)
 
         if name in universe_map:
-            return self._wrap_universe(f)
+            f = self._wrap_universe(f)
 
         if name in in_place_map:
-            return self._wrap_in_place(f)
+            f = self._wrap_in_place(f)
 
         return f
 
@@ -7,6 +7,8 @@ import os
 import tempfile
 import unittest
 
+from sqlalchemy import event
+
 from ..config import config
 from ..manager import Manager
 
@@ -22,18 +24,28 @@ logger = logging.getLogger(__name__)
 TEST_CONNECTION = config.get('test_connection')
 
 
+def _set_disposable_sqlite_pragmas(dbapi_connection, _) -> None:
+    """Skip syncing to disk and keep the rollback journal in memory for a SQLite database only used by tests."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.close()
+
+
+#: An in-memory SQLite database. SQLAlchemy keeps one connection to it per thread, so it lives as long as the engine.
+IN_MEMORY_CONNECTION = 'sqlite://'
+
+
 class TemporaryCacheMixin(unittest.TestCase):
-    """A test case that has a connection and a manager that is created for each test function."""
+    """A test case that has a connection and a manager that is created for each test function.
+
+    Unless a test connection is configured, each test function gets its own in-memory SQLite database, which avoids
+    creating, writing, and deleting a file for every test.
+    """
 
     def setUp(self):
         """Set up the test function with a connection and manager."""
-        if TEST_CONNECTION:
-            self.connection = TEST_CONNECTION
-        else:
-            self.fd, self.path = tempfile.mkstemp()
-            self.connection = 'sqlite:///' + self.path
-            logger.info('Test generated connection string %s', self.connection)
-
+        self.connection = TEST_CONNECTION or IN_MEMORY_CONNECTION
         self.manager = Manager(connection=self.connection, autoflush=True)
         self.manager.create_all()
 
@@ -41,17 +53,21 @@ class TemporaryCacheMixin(unittest.TestCase):
         """Tear down the test function by closing the session and removing the database."""
         self.manager.session.close()
 
-        if not TEST_CONNECTION:
-            os.close(self.fd)
-            os.remove(self.path)
-        else:
+        if TEST_CONNECTION:
             self.manager.drop_all()
+        else:
+            self.manager.engine.dispose()
 
 
 class TemporaryCacheClsMixin(unittest.TestCase):
-    """A test case that has a connection and a manager that is created for each test class."""
+    """A test case that has a connection and a manager that is created for each test class.
+
+    Unless a test connection is configured, the SQLite database is made in a temporary directory so any journal files
+    SQLite leaves next to it are removed along with it. Since it's thrown away afterwards, SQLite is also told not to
+    wait for writes to reach the disk.
+    """
 
-    fd, path, manager = None, None, None
+    directory, path, manager = None, None, None
 
     @classmethod
     def setUpClass(cls):
@@ -59,11 +75,14 @@ class TemporaryCacheClsMixin(unittest.TestCase):
         if TEST_CONNECTION:
             cls.connection = TEST_CONNECTION
         else:
-            cls.fd, cls.path = tempfile.mkstemp()
+            cls.directory = tempfile.TemporaryDirectory()
+            cls.path = os.path.join(cls.directory.name, 'test.db')
             cls.connection = 'sqlite:///' + cls.path
             logger.info('Test generated connection string %s', cls.connection)
 
         cls.manager = Manager(connection=cls.connection, autoflush=True)
+        if not TEST_CONNECTION:
+            event.listen(cls.manager.engine, 'connect', _set_disposable_sqlite_pragmas)
         cls.manager.create_all()
 
     @classmethod
@@ -72,8 +91,8 @@ class TemporaryCacheClsMixin(unittest.TestCase):
         cls.manager.session.close()
 
         if not TEST_CONNECTION:
-            os.close(cls.fd)
-            os.remove(cls.path)
+            cls.manager.engine.dispose()
+            cls.directory.cleanup()
         else:
             cls.manager.drop_all()
 
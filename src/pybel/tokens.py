@@ -26,10 +26,11 @@ def parse_result_to_dsl(tokens) -> BaseEntity:
 
     :type tokens: dict or pyparsing.ParseResults
     """
+    # Modified terms, like activities and translocations, are nodes for their target
     if MODIFIER in tokens:
-        return parse_result_to_dsl(tokens[TARGET])
+        tokens = tokens[TARGET]
 
-    elif REACTION == tokens[FUNCTION]:
+    if REACTION == tokens[FUNCTION]:
         return _reaction_po_to_dict(tokens)
 
     elif VARIANTS in tokens:
@@ -53,41 +54,27 @@ def _fusion_to_dsl(tokens) -> FusionBase:
     func = tokens[FUNCTION]
     fusion_dsl = FUNC_TO_FUSION_DSL[func]
     member_dsl = FUNC_TO_DSL[func]
+    fusion = tokens[FUSION]
 
-    partner_5p = tokens[FUSION][PARTNER_5P]
-    partner_5p_concept = (
-        partner_5p[CONCEPT]
-        if CONCEPT in tokens[FUSION][PARTNER_5P] else
-        partner_5p
-    )
-    partner_5p_node = member_dsl(
-        namespace=partner_5p_concept[NAMESPACE],
-        name=partner_5p_concept[NAME],
-        identifier=partner_5p_concept.get(IDENTIFIER),
-        xrefs=partner_5p.get(XREFS),
+    return fusion_dsl(
+        partner_5p=_fusion_partner_to_dsl(member_dsl, fusion[PARTNER_5P]),
+        partner_3p=_fusion_partner_to_dsl(member_dsl, fusion[PARTNER_3P]),
+        range_5p=_fusion_range_to_dsl(fusion[RANGE_5P]),
+        range_3p=_fusion_range_to_dsl(fusion[RANGE_3P]),
     )
 
-    partner_3p = tokens[FUSION][PARTNER_3P]
-    partner_3p_concept = (
-        partner_3p[CONCEPT]
-        if CONCEPT in tokens[FUSION][PARTNER_3P] else
-        partner_3p
-    )
-    partner_3p_node = member_dsl(
-        namespace=partner_3p_concept[NAMESPACE],
-        name=partner_3p_concept[NAME],
-        identifier=partner_3p_concept.get(IDENTIFIER),
-        xrefs=partner_3p.get(XREFS),
-    )
 
-    range_5p = _fusion_range_to_dsl(tokens[FUSION][RANGE_5P])
-    range_3p = _fusion_range_to_dsl(tokens[FUSION][RANGE_3P])
+def _fusion_partner_to_dsl(member_dsl, tokens) -> CentralDogma:
+    """Convert a PyParsing data dictionary for one of the partners in a fusion to a DSL object.
 
-    return fusion_dsl(
-        partner_5p=partner_5p_node,
-        partner_3p=partner_3p_node,
-        range_5p=range_5p,
-        range_3p=range_3p,
+    :type tokens: ParseResult
+    """
+    concept = tokens[CONCEPT] if CONCEPT in tokens else tokens
+    return member_dsl(
+        namespace=concept[NAMESPACE],
+        name=concept[NAME],
+        identifier=concept.get(IDENTIFIER),
+        xrefs=tokens.get(XREFS),
     )
 
 
@@ -152,39 +139,69 @@ def _variant_to_dsl_helper(tokens) -> Variant:
     :type tokens: ParseResult
     """
     kind = tokens[KIND]
+    variant_to_dsl = _KIND_TO_VARIANT_DSL.get(kind)
+    if variant_to_dsl is None:
+        raise ValueError('invalid fragment kind: {}'.format(kind))
+    return variant_to_dsl(tokens)
+
+
+def _hgvs_to_dsl(tokens) -> Hgvs:
+    """Convert tokens for an HGVS variant to a DSL object.
+
+    :type tokens: ParseResult
+    """
+    return Hgvs(tokens[HGVS])
+
+
+def _gmod_to_dsl(tokens) -> GeneModification:
+    """Convert tokens for a gene modification to a DSL object.
+
+    :type tokens: ParseResult
+    """
+    concept = tokens[CONCEPT]
+    return GeneModification(
+        name=concept[NAME],
+        namespace=concept[NAMESPACE],
+        identifier=concept.get(IDENTIFIER),
+        xrefs=tokens.get(XREFS),
+    )
+
+
+def _pmod_to_dsl(tokens) -> ProteinModification:
+    """Convert tokens for a protein modification to a DSL object.
+
+    :type tokens: ParseResult
+    """
+    concept = tokens[CONCEPT]
+    return ProteinModification(
+        name=concept[NAME],
+        namespace=concept[NAMESPACE],
+        identifier=concept.get(IDENTIFIER),
+        xrefs=tokens.get(XREFS),
+        code=tokens.get(PMOD_CODE),
+        position=tokens.get(PMOD_POSITION),
+    )
+
+
+def _fragment_to_dsl(tokens) -> Fragment:
+    """Convert tokens for a fragment to a DSL object.
+
+    :type tokens: ParseResult
+    """
+    return Fragment(
+        start=tokens.get(FRAGMENT_START),
+        stop=tokens.get(FRAGMENT_STOP),
+        description=tokens.get(FRAGMENT_DESCRIPTION),
+    )
+
 
-    if kind == HGVS:
-        return Hgvs(tokens[HGVS])
-
-    if kind == GMOD:
-        concept = tokens[CONCEPT]
-        return GeneModification(
-            name=concept[NAME],
-            namespace=concept[NAMESPACE],
-            identifier=concept.get(IDENTIFIER),
-            xrefs=tokens.get(XREFS),
-        )
-
-    if kind == PMOD:
-        concept = tokens[CONCEPT]
-        return ProteinModification(
-            name=concept[NAME],
-            namespace=concept[NAMESPACE],
-            identifier=concept.get(IDENTIFIER),
-            xrefs=tokens.get(XREFS),
-            code=tokens.get(PMOD_CODE),
-            position=tokens.get(PMOD_POSITION),
-        )
-
-    if kind == FRAGMENT:
-        start, stop = tokens.get(FRAGMENT_START), tokens.get(FRAGMENT_STOP)
-        return Fragment(
-            start=start,
-            stop=stop,
-            description=tokens.get(FRAGMENT_DESCRIPTION),
-        )
-
-    raise ValueError('invalid fragment kind: {}'.format(kind))
+#: Converters for each kind of variant, looked up by :func:`_variant_to_dsl_helper`
+_KIND_TO_VARIANT_DSL = {
+    HGVS: _hgvs_to_dsl,
+    GMOD: _gmod_to_dsl,
+    PMOD: _pmod_to_dsl,
+    FRAGMENT: _fragment_to_dsl,
+}
 
 
 def _reaction_po_to_dict(tokens) -> Reaction:
@@ -167,8 +167,8 @@ def _get_edge_tuple(
     :return: A tuple that can be hashed representing this edge. Makes no promises to its structure.
     """
     return (
-        source.as_bel(),
-        target.as_bel(),
+        source.canonical_bel,
+        target.canonical_bel,
         _get_citation_str(edge_data),
         edge_data.get(EVIDENCE),
         canonicalize_edge(edge_data),
@@ -64,20 +64,16 @@ def assert_has_node(self: unittest.TestCase, node: BaseEntity, graph: BELGraph,
     """Check if a node with the given properties is contained within a graph."""
     self.assertIsInstance(node, BaseEntity)
 
-    self.assertIn(
-        node,
-        graph,
-        msg='{} not found in graph. Other nodes:\n{}'.format(node.as_bel(), '\n'.join(
+    # The message lists the BEL of every node, so it's only built if the node is missing
+    if node not in graph:
+        self.fail('{} not found in graph. Other nodes:\n{}'.format(node.as_bel(), '\n'.join(
             n.as_bel()
             for n in graph
-        )),
-    )
+        )))
 
-    if kwargs:
+    if kwargs and not kwargs.items() <= graph.nodes[node].items():
         missing = set(kwargs) - set(graph.nodes[node])
         self.assertFalse(missing, msg="Missing {} in node data".format(', '.join(sorted(missing))))
-        self.assertTrue(all(kwarg in graph.nodes[node] for kwarg in kwargs),
-                        msg="Missing kwarg in node data")
         self.assertEqual(kwargs, {k: graph.nodes[node][k] for k in kwargs},
                          msg="Wrong values in node data")
 
@@ -121,29 +117,31 @@ def assert_has_edge(
     self.assertIsInstance(u, BaseEntity)
     self.assertIsInstance(v, BaseEntity)
 
-    self.assertTrue(
-        graph.has_edge(u, v),
-        msg='Edge ({}, {}) not in graph. Other edges:\n{}'.format(u, v, '\n'.join(
+    # Look up the edges between u and v once, instead of once for has_edge() and again for each check below
+    key_to_data = graph.adj.get(u, {}).get(v)
+
+    # The message lists the BEL of every edge, so it's only built if the edge is missing
+    if key_to_data is None:
+        self.fail('Edge ({}, {}) not in graph. Other edges:\n{}'.format(u, v, '\n'.join(
             edge_to_bel(u, v, d, use_identifiers=use_identifiers)
             for u, v, d in graph.edges(data=True)
-        ))
-    )
+        )))
 
     if not kwargs:
         return
 
     if permissive:
-        matches = any_subdict_matches(graph[u][v], kwargs)
+        matches = any_subdict_matches(key_to_data, kwargs)
     else:
-        matches = any_dict_matches(graph[u][v], kwargs)
-
-    msg = 'No edge ({}, {}) with correct properties. expected:\n {}\nbut got:\n{}'.format(
-        u,
-        v,
-        dumps(kwargs, indent=2, sort_keys=True),
-        str(graph[u][v])
-    )
-    self.assertTrue(matches, msg=msg)
+        matches = any_dict_matches(key_to_data, kwargs)
+
+    if not matches:
+        self.fail('No edge ({}, {}) with correct properties. expected:\n {}\nbut got:\n{}'.format(
+            u,
+            v,
+            dumps(kwargs, indent=2, sort_keys=True),
+            str(key_to_data)
+        ))
 
 
 class TestGraphMixin(unittest.TestCase):
@@ -5,10 +5,10 @@
 import unittest
 
 from pybel import BELGraph
-from pybel.constants import NAME
+from pybel.constants import NAME, VARIANTS
 from pybel.dsl import (
     Abundance, ComplexAbundance, CompositeAbundance, EnumeratedFusionRange, Fragment, Gene, GeneFusion,
-    ListAbundanceEmptyException, MissingFusionRange, Protein, Reaction, ReactionEmptyException,
+    ListAbundanceEmptyException, MissingFusionRange, Protein, ProteinModification, Reaction, ReactionEmptyException,
 )
 from pybel.language import Entity
 from pybel.testing.utils import n
@@ -87,6 +87,16 @@ class TestDSL(unittest.TestCase):
         node = Abundance(namespace=namespace, name=name)
         self.assertEqual(hash(node), hash(node.as_bel()))
 
+    def test_hash_after_change(self):
+        """Test that the hash and equality of a node follow changes to it."""
+        node = Protein(namespace='HGNC', name='A')
+        self.assertEqual(Protein(namespace='HGNC', name='A'), node)
+
+        node.setdefault(VARIANTS, []).append(ProteinModification('Ph'))
+        self.assertEqual('p(HGNC:A, pmod(Ph))', node.as_bel())
+        self.assertNotEqual(Protein(namespace='HGNC', name='A'), node)
+        self.assertEqual(hash(node), hash(node.as_bel()))
+
     def test_empty_complex(self):
         """Test that an empty complex causes a failure."""
         with self.assertRaises(ValueError):
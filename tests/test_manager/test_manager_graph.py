@@ -123,7 +123,7 @@ class TestNetworkCache(BelReconstitutionMixin, FleetingTemporaryCacheMixin):
         self.assertEqual({network.id, network_copy.id}, {network.id for network in query_networks_result})
 
         expected_versions = {'1.0.1', '1.0.0'}
-        self.assertEqual(expected_versions, set(self.manager.get_network_versions(graph.name)))
+        self.assertEqual(expected_versions, self.manager.get_network_versions(graph.name))
 
         exact_name_version = from_database(graph.name, graph.version, manager=self.manager)
         self.assertEqual(graph.name, exact_name_version.name)
@@ -172,9 +172,11 @@ class TestTemporaryInsertNetwork(TemporaryCacheMixin):
         # TODO check that the database doesn't have anything for TEST in it
 
 
-class TestTypedQuery(TemporaryCacheMixin):
-    def setUp(self):
-        super().setUp()
+class TestTypedQuery(TemporaryCacheClsMixin):
+    @classmethod
+    def setUpClass(cls):
+        """Set up the class with a graph in the database that is only queried by its tests."""
+        super().setUpClass()
 
         graph = BELGraph(name='test', version='0.0.0')
         graph.annotation_list['TEST'] = {'a', 'b', 'c'}
@@ -193,11 +195,11 @@ class TestTypedQuery(TemporaryCacheMixin):
             citation=n(),
         )
 
-        make_dummy_namespaces(self.manager, graph)
-        make_dummy_annotations(self.manager, graph)
+        make_dummy_namespaces(cls.manager, graph)
+        make_dummy_annotations(cls.manager, graph)
 
         with mock_bel_resources:
-            self.manager.insert_graph(graph)
+            cls.manager.insert_graph(graph)
 
     def test_query_edge_source_type(self):
         rv = self.manager.query_edges(source_function=MIRNA).all()
@@ -207,9 +209,11 @@ class TestTypedQuery(TemporaryCacheMixin):
         self.assertEqual(2, len(rv))
 
 
-class TestQuery(TemporaryCacheMixin):
-    def setUp(self):
-        super(TestQuery, self).setUp()
+class TestQuery(TemporaryCacheClsMixin):
+    @classmethod
+    def setUpClass(cls):
+        """Set up the class with a graph in the database that is only queried by its tests."""
+        super().setUpClass()
 
         graph = BELGraph(name='test', version='0.0.0')
         graph.annotation_list['TEST'] = {'a', 'b', 'c'}
@@ -224,11 +228,11 @@ class TestQuery(TemporaryCacheMixin):
             }
         )
 
-        make_dummy_namespaces(self.manager, graph)
-        make_dummy_annotations(self.manager, graph)
+        make_dummy_namespaces(cls.manager, graph)
+        make_dummy_annotations(cls.manager, graph)
 
         with mock_bel_resources:
-            self.manager.insert_graph(graph)
+            cls.manager.insert_graph(graph)
 
     def test_query_node_bel_1(self):
         rv = self.manager.query_nodes(bel='p(HGNC:FOS)').all()
@@ -2027,6 +2027,41 @@ class TestTransformation(TestTokenParserBase):
         self.assertFalse(self.parser.control_parser.citation_is_set)
 
 
+class TestTermTags(TestTokenParserBase):
+    """Test that the order of the alternatives for BEL terms doesn't change which function a tag is parsed as."""
+
+    def test_functions(self):
+        """Test that tags sharing a prefix are parsed as the right functions."""
+        for bel, function in [
+            ('a(CHEBI:water)', ABUNDANCE),
+            ('abundance(CHEBI:water)', ABUNDANCE),
+            ('complex(p(HGNC:AKT1), p(HGNC:AKT2))', COMPLEX),
+            ('complexAbundance(p(HGNC:AKT1), p(HGNC:AKT2))', COMPLEX),
+            ('composite(p(HGNC:AKT1), p(HGNC:AKT2))', COMPOSITE),
+            ('compositeAbundance(p(HGNC:AKT1), p(HGNC:AKT2))', COMPOSITE),
+            ('p(HGNC:AKT1)', PROTEIN),
+            ('path(MESH:disease)', PATHOLOGY),
+            ('r(HGNC:AKT1)', RNA),
+            ('rxn(reactants(a(CHEBI:water)), products(a(CHEBI:oxygen)))', REACTION),
+            ('m(HGNC:MIR21)', MIRNA),
+            ('g(HGNC:AKT1)', GENE),
+            ('bp(GO:apoptosis)', BIOPROCESS),
+        ]:
+            with self.subTest(bel=bel):
+                self.assertEqual(function, self.parser.bel_term.parseString(bel)[FUNCTION])
+
+    def test_modifiers(self):
+        """Test that modifier tags sharing a prefix with function tags are parsed as the right modifiers."""
+        for bel, modifier in [
+            ('act(p(HGNC:AKT1))', ACTIVITY),
+            ('activity(p(HGNC:AKT1))', ACTIVITY),
+            ('deg(p(HGNC:AKT1))', DEGRADATION),
+            ('tloc(p(HGNC:AKT1), fromLoc(GO:cytoplasm), toLoc(GO:nucleus))', TRANSLOCATION),
+        ]:
+            with self.subTest(bel=bel):
+                self.assertEqual(modifier, self.parser.bel_term.parseString(bel)[MODIFIER])
+
+
 class TestSemantics(unittest.TestCase):
     def test_lenient_semantic_no_failure(self):
         graph = BELGraph()
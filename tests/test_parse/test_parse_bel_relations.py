@@ -1040,7 +1040,9 @@ class TestRelations(TestTokenParserBase):
 
 
 class TestCustom(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        """Build a BEL parser with custom namespaces that persists through the class."""
         graph = BELGraph()
 
         namespace_to_term = {
@@ -1053,7 +1055,12 @@ class TestCustom(unittest.TestCase):
             }
         }
 
-        self.parser = BELParser(graph, namespace_to_term_to_encoding=namespace_to_term, autostreamline=False)
+        cls.parser = BELParser(graph, namespace_to_term_to_encoding=namespace_to_term, autostreamline=False)
+
+    def test_control_keyword_prefix(self):
+        """Test that a line is only parsed as a control statement if its first word is SET or UNSET."""
+        with self.assertRaises(ParseException):
+            self.parser.parseString('UNSETX(p(HGNC:AKT1)) -> p(HGNC:YFG)')
 
     def test_tloc_undefined_namespace(self):
         s = 'tloc(p(HGNC:AKT1), fromLoc(MESH:nucleus), toLoc(MISSING:"undefined"))'
@@ -2,8 +2,10 @@
 
 """Test parsing variants."""
 
-import logging
 import unittest
+from unittest import mock
+
+from pyparsing import ParseException, ParserElement
 
 from pybel.constants import (
     BEL_DEFAULT_NAMESPACE, CONCEPT, FRAGMENT, FRAGMENT_DESCRIPTION, FRAGMENT_MISSING, FRAGMENT_START, FRAGMENT_STOP,
@@ -15,89 +17,41 @@ from pybel.language import Entity
 from pybel.parser import ConceptParser
 from pybel.parser.modifiers import (
     get_fragment_language, get_fusion_language, get_gene_modification_language, get_gene_substitution_language,
-    get_hgvs_language, get_location_language, get_protein_modification_language, get_protein_substitution_language,
-    get_truncation_language,
+    get_hgvs_language, get_legacy_fusion_langauge, get_location_language, get_protein_modification_language,
+    get_protein_substitution_language, get_truncation_language,
 )
 
-log = logging.getLogger(__name__)
-
 
 class TestHGVSParser(unittest.TestCase):
-    def setUp(self):
-        self.parser = get_hgvs_language()
-
-    def test_protein_del(self):
-        statement = 'variant(p.Phe508del)'
-        expected = Hgvs('p.Phe508del')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_protein_del_quoted(self):
-        statement = 'variant("p.Phe508del")'
-        expected = Hgvs('p.Phe508del')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_protein_mut(self):
-        statement = 'var(p.Gly576Ala)'
-        expected = Hgvs('p.Gly576Ala')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_unspecified(self):
-        statement = 'var(=)'
-        expected = Hgvs('=')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_frameshift(self):
-        statement = 'variant(p.Thr1220Lysfs)'
-        expected = Hgvs('p.Thr1220Lysfs')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_snp(self):
-        statement = 'var(c.1521_1523delCTT)'
-        expected = Hgvs('c.1521_1523delCTT')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_chromosome_1(self):
-        statement = 'variant(g.117199646_117199648delCTT)'
-        expected = Hgvs('g.117199646_117199648delCTT')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_chromosome_2(self):
-        statement = 'var(c.1521_1523delCTT)'
-        expected = Hgvs('c.1521_1523delCTT')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_rna_del(self):
-        statement = 'var(r.1653_1655delcuu)'
-        expected = Hgvs('r.1653_1655delcuu')
-        result = self.parser.parseString(statement)
-        self.assertEqual(expected, result.asDict())
-
-    def test_protein_trunc_triple(self):
-        statement = 'var(p.Cys65*)'
-        result = self.parser.parseString(statement)
-        expected = Hgvs('p.Cys65*')
-        self.assertEqual(expected, result.asDict())
-
-    def test_protein_trunc_legacy(self):
-        statement = 'var(p.65*)'
-        result = self.parser.parseString(statement)
-        expected = Hgvs('p.65*')
-        self.assertEqual(expected, result.asDict())
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = get_hgvs_language()
+
+    def test_hgvs(self):
+        """Test parsing variants with the short and long tags and bare and quoted HGVS strings."""
+        for statement, variant in [
+            ('variant(p.Phe508del)', 'p.Phe508del'),  # protein deletion
+            ('variant("p.Phe508del")', 'p.Phe508del'),  # quoted protein deletion
+            ('var(p.Gly576Ala)', 'p.Gly576Ala'),  # protein substitution
+            ('var(=)', '='),  # unspecified
+            ('variant(p.Thr1220Lysfs)', 'p.Thr1220Lysfs'),  # frameshift
+            ('var(c.1521_1523delCTT)', 'c.1521_1523delCTT'),  # SNP
+            ('variant(g.117199646_117199648delCTT)', 'g.117199646_117199648delCTT'),  # chromosome
+            ('var(r.1653_1655delcuu)', 'r.1653_1655delcuu'),  # RNA deletion
+            ('var(p.Cys65*)', 'p.Cys65*'),  # protein truncation
+            ('var(p.65*)', 'p.65*'),  # legacy protein truncation
+        ]:
+            with self.subTest(statement=statement):
+                result = self.parser.parseString(statement)
+                self.assertEqual(Hgvs(variant), result.asDict())
 
 
 class TestPmod(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         identifier_parser = ConceptParser()
         identifier_qualified = identifier_parser.identifier_qualified
-        self.parser = get_protein_modification_language(identifier_qualified)
+        cls.parser = get_protein_modification_language(identifier_qualified)
 
     def _help_test_pmod_simple(self, statement):
         result = self.parser.parseString(statement)
@@ -198,12 +152,13 @@ class TestPmod(unittest.TestCase):
 
 
 class TestGeneModification(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         identifier_parser = ConceptParser()
         identifier_qualified = identifier_parser.identifier_qualified
-        self.parser = get_gene_modification_language(identifier_qualified)
+        cls.parser = get_gene_modification_language(identifier_qualified)
 
-        self.expected = GeneModification('Me')
+        cls.expected = GeneModification('Me')
 
     def test_dsl(self):
         self.assertEqual({
@@ -231,8 +186,9 @@ class TestGeneModification(unittest.TestCase):
 
 
 class TestProteinSubstitution(unittest.TestCase):
-    def setUp(self):
-        self.parser = get_protein_substitution_language()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = get_protein_substitution_language()
 
     def test_psub_1(self):
         statement = 'sub(A, 127, Y)'
@@ -250,8 +206,9 @@ class TestProteinSubstitution(unittest.TestCase):
 
 
 class TestGeneSubstitutionParser(unittest.TestCase):
-    def setUp(self):
-        self.parser = get_gene_substitution_language()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = get_gene_substitution_language()
 
     def test_gsub(self):
         statement = 'sub(G,308,A)'
@@ -264,8 +221,9 @@ class TestGeneSubstitutionParser(unittest.TestCase):
 class TestFragmentParser(unittest.TestCase):
     """See http://openbel.org/language/web/version_2.0/bel_specification_version_2.0.html#_examples_2"""
 
-    def setUp(self):
-        self.parser = get_fragment_language()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = get_fragment_language()
 
     def _help_test_known_length(self, s):
         result = self.parser.parseString(s)
@@ -345,8 +303,9 @@ class TestFragmentParser(unittest.TestCase):
 
 
 class TestTruncationParser(unittest.TestCase):
-    def setUp(self):
-        self.parser = get_truncation_language()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = get_truncation_language()
 
     def test_trunc_1(self):
         statement = 'trunc(40)'
@@ -371,10 +330,11 @@ class TestTruncationParser(unittest.TestCase):
 
 
 class TestFusionParser(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         identifier_parser = ConceptParser()
         identifier_qualified = identifier_parser.identifier_qualified
-        self.parser = get_fusion_language(identifier_qualified)
+        cls.parser = get_fusion_language(identifier_qualified)
 
     def test_rna_fusion_known_breakpoints(self):
         """RNA abundance of fusion with known breakpoints"""
@@ -502,12 +462,55 @@ class TestFusionParser(unittest.TestCase):
 
         self.assertEqual(expected, result.asDict())
 
+    def test_quoted_breakpoints(self):
+        """Test that quoted and unquoted breakpoints give the same result."""
+        quoted = self.parser.parseString('fus(HGNC:TMPRSS2, "r.1_79", HGNC:ERG, "?")')
+        unquoted = self.parser.parseString('fus(HGNC:TMPRSS2, r.1_79, HGNC:ERG, ?)')
+        self.assertEqual(unquoted.asDict(), quoted.asDict())
+
+    def test_mismatched_quotes(self):
+        """Test that a breakpoint with only an opening quote is rejected."""
+        with self.assertRaises(ParseException):
+            self.parser.parseString('fus(HGNC:TMPRSS2, "r.1_79, HGNC:ERG, ?)')
+
+    def test_strict_quotes(self):
+        """Test that unquoted breakpoints are rejected if the parser isn't permissive."""
+        parser = get_fusion_language(ConceptParser().identifier_qualified, permissive=False)
+        parser.parseString('fus(HGNC:TMPRSS2, "r.1_79", HGNC:ERG, "?")')
+        with self.assertRaises(ParseException):
+            parser.parseString('fus(HGNC:TMPRSS2, r.1_79, HGNC:ERG, ?)')
+
+
+class TestPackrat(unittest.TestCase):
+    """Tests that packrat memoization doesn't change the results of parsing variants."""
+
+    def assert_same_without_packrat(self, parser, statement):
+        """Assert the statement parses to the same dictionary with and without the packrat cache."""
+        expected = parser.parseString(statement).asDict()
+        with mock.patch.object(ParserElement, '_parse', ParserElement._parseNoCache):
+            self.assertEqual(expected, parser.parseString(statement).asDict())
+
+    def test_hgvs(self):
+        self.assert_same_without_packrat(get_hgvs_language(), 'var("p.Phe508del")')
+
+    def test_fusion(self):
+        identifier_qualified = ConceptParser().identifier_qualified
+        parser = get_fusion_language(identifier_qualified)
+        self.assert_same_without_packrat(parser, 'fus(HGNC:TMPRSS2, "r.1_79", HGNC:ERG, r.?_1)')
+
+    def test_legacy_fusion(self):
+        """Test the legacy fusion, whose parse action adds the missing ranges to its tokens."""
+        identifier_qualified = ConceptParser().identifier_qualified
+        parser = get_legacy_fusion_langauge(identifier_qualified, 'r')
+        self.assert_same_without_packrat(parser, 'HGNC:TMPRSS2, fus(HGNC:ERG, 79, ?)')
+
 
 class TestLocation(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         identifier_parser = ConceptParser()
         identifier_qualified = identifier_parser.identifier_qualified
-        self.parser = get_location_language(identifier_qualified)
+        cls.parser = get_location_language(identifier_qualified)
 
     def test_a(self):
         statement = 'loc(GO:intracellular)'
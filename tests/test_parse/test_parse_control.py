@@ -111,6 +111,10 @@ class TestSetCitation(unittest.TestCase):
     def test_parser_triple_spaced(self):
         set_citation_stub.parseString('Citation = {"PubMed Central", "Trends in molecular medicine", "12928037"}')
 
+    def test_parser_comma_in_value(self):
+        result = set_citation_stub.parseString('Citation = { "PubMed","Trends, in medicine" , "12928037" }')
+        self.assertEqual(['PubMed', 'Trends, in medicine', '12928037'], result['values'].asList())
+
 
 class TestParseControlSetStatementErrors(TestParseControl):
     def test_invalid_citation_type(self):
@@ -174,6 +178,19 @@ class TestParseControl2(TestParseControl):
         self.parser.parseString(s2)
         self.assertIsNone(self.parser.statement_group, msg='problem with unset')
 
+    def test_independent_parsers(self):
+        """Test that control statements only change the state of the parser that parsed them."""
+        other = ControlParser()
+        self.parser.parseString(SET_CITATION_TEST)
+        self.parser.parseString('SET Evidence = "I read it"')
+        self.assertIsNone(other.citation_db_id)
+        self.assertIsNone(other.evidence)
+
+        other.parseString('SET Citation = {"PubMed", "1"}')
+        other.parseString('UNSET ALL')
+        self.assertEqual(test_citation_dict[CITATION_IDENTIFIER], self.parser.citation_db_id)
+        self.assertEqual('I read it', self.parser.evidence)
+
     def test_citation_short(self):
         self.parser.parseString(SET_CITATION_TEST)
         self.assertEqual(test_citation_dict[CITATION_IDENTIFIER], self.parser.citation_db_id)
@@ -276,6 +293,14 @@ class TestParseControl2(TestParseControl):
 
         self.assertEqual(expected_annotation, self.parser.annotations)
 
+    def test_custom_annotation_unquoted(self):
+        self.parser.parseString(SET_CITATION_TEST)
+        result = self.parser.parseString('SET Custom1=Custom1_B')
+
+        self.assertEqual(['Custom1', 'Custom1_B'], result.asList())
+        self.assertEqual({'key': 'Custom1', 'value': 'Custom1_B'}, result.asDict())
+        self.assertEqual({'Custom1': 'Custom1_B'}, self.parser.annotations)
+
     def test_custom_annotation_list(self):
         s = [
             SET_CITATION_TEST,
@@ -2,10 +2,15 @@
 
 """Tests for parsing utilities."""
 
+import os
 import unittest
+from unittest import mock
 
 import networkx as nx
+from pyparsing import ParseException, ParserElement
 
+from pybel.parser.baseparser import PYBEL_PACKRAT_CACHE, _get_packrat_cache_size_limit, enable_packrat
+from pybel.parser.utils import one_of_keywords
 from pybel.utils import subdict_matches
 from tests.constants import any_subdict_matches
 
@@ -131,3 +136,79 @@ class TestSubdictMatching(unittest.TestCase):
         d = {'relation': 'yup'}
 
         self.assertTrue(any_subdict_matches(g[1][2], d))
+
+
+class TestOneOfKeywords(unittest.TestCase):
+    """Tests for matching keyword tags."""
+
+    def test_longest_first(self):
+        """Test that a tag isn't shadowed by one of its prefixes."""
+        parser = one_of_keywords(['p', 'path'])
+        self.assertEqual(['path'], parser.parseString('path(MESH:X)').asList())
+        self.assertEqual(['p'], parser.parseString('p(HGNC:X)').asList())
+
+    def test_word_boundary(self):
+        """Test that a word tag doesn't match the beginning of a longer word."""
+        parser = one_of_keywords(['p', 'proteinAbundance'])
+        with self.assertRaises(ParseException):
+            parser.parseString('pmod(Ph)')
+
+    def test_symbols(self):
+        """Test that tags made of symbols don't need a word boundary."""
+        parser = one_of_keywords(['->', 'increases'])
+        self.assertEqual(['->'], parser.parseString('->p(HGNC:X)').asList())
+
+    def test_deterministic_order(self):
+        """Test that tags of the same length are ordered alphabetically regardless of the input order."""
+        expected = 'phos | cat | kin | pep'
+        self.assertEqual(expected, str(one_of_keywords(['pep', 'cat', 'phos', 'kin'])))
+        self.assertEqual(expected, str(one_of_keywords(['kin', 'phos', 'pep', 'cat'])))
+
+
+class TestPackratCacheSize(unittest.TestCase):
+    """Tests for reading the packrat cache size from the environment."""
+
+    def _get(self, value):
+        with mock.patch.dict(os.environ, {PYBEL_PACKRAT_CACHE: value}):
+            return _get_packrat_cache_size_limit()
+
+    def test_unbounded(self):
+        self.assertIsNone(self._get(''))
+        self.assertIsNone(self._get('0'))
+
+    def test_bounded(self):
+        self.assertEqual(4096, self._get('4096'))
+
+    def test_disabled(self):
+        self.assertEqual(-1, self._get('-1'))
+
+    def test_invalid(self):
+        self.assertIsNone(self._get('lots'))
+
+
+class TestEnablePackrat(unittest.TestCase):
+    """Tests for enabling packrat parsing with the cache size from the environment."""
+
+    def _enable(self, value=None):
+        with mock.patch.dict(os.environ), mock.patch.object(ParserElement, 'enablePackrat') as enable_packrat_mock:
+            if value is None:
+                os.environ.pop(PYBEL_PACKRAT_CACHE, None)
+            else:
+                os.environ[PYBEL_PACKRAT_CACHE] = value
+            enable_packrat()
+        return enable_packrat_mock
+
+    def test_unset(self):
+        self._enable().assert_called_once_with(cache_size_limit=None)
+
+    def test_unbounded(self):
+        self._enable('0').assert_called_once_with(cache_size_limit=None)
+
+    def test_bounded(self):
+        self._enable('4096').assert_called_once_with(cache_size_limit=4096)
+
+    def test_disabled(self):
+        self._enable('-1').assert_not_called()
+
+    def test_invalid(self):
+        self._enable('lots').assert_called_once_with(cache_size_limit=None)
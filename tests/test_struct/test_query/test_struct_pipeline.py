@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import functools
+import inspect
 import logging
 import unittest
 from io import StringIO
@@ -8,7 +10,7 @@ from pybel import BELGraph
 from pybel.examples.egf_example import egf_graph
 from pybel.struct.mutation import enrich_protein_and_rna_origins
 from pybel.struct.pipeline import Pipeline
-from pybel.struct.pipeline.decorators import get_transformation, mapped
+from pybel.struct.pipeline.decorators import _count_parameters, get_transformation, mapped
 from pybel.struct.pipeline.exc import MetaValueError, MissingPipelineFunctionError
 
 log = logging.getLogger(__name__)
@@ -30,6 +32,39 @@ class TestEgfExample(unittest.TestCase):
                          msg='original graph edges should remain unchanged')
 
 
+class TestCountParameters(unittest.TestCase):
+    """Test counting the parameters of transformation functions."""
+
+    def test_registered(self):
+        """Test that the count matches the signature for all registered transformations."""
+        for name, func in mapped.items():
+            with self.subTest(name=name):
+                self.assertEqual(len(inspect.signature(func).parameters), _count_parameters(func))
+
+    def test_variadic(self):
+        def f(graph, *args, key=None, **kwargs):
+            pass
+
+        self.assertEqual(4, _count_parameters(f))
+
+    def test_wrapped(self):
+        def f(graph, universe):
+            pass
+
+        @functools.wraps(f)
+        def g(*args, **kwargs):
+            return f(*args, **kwargs)
+
+        self.assertEqual(2, _count_parameters(g))
+
+    def test_bound_method(self):
+        class A:
+            def f(self, graph, universe):
+                pass
+
+        self.assertEqual(2, _count_parameters(A().f))
+
+
 class TestPipelineFailures(unittest.TestCase):
 
     def test_assert_failure(self):